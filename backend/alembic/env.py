@@ -21,8 +21,12 @@ from app.models.category import Category
 from app.models.badge import Badge, UserBadge
 from app.models.resource import Resource
 from app.models.forum import ForumPost, Comment
-from app.models.notification import Notification
+from app.models.notification import Notification, NotificationArchive
 from app.models.leaderboard import LeaderboardSnapshot
+from app.models.points import PointsLedgerEntry, PointsCheckpoint
+from app.models.season import Season, SeasonStanding
+from app.models.reference import ReferenceDataVersion
+from app.models.recommendation import TeamRecommendation
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
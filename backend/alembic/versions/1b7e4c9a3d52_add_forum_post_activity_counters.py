@@ -0,0 +1,48 @@
+"""Add forum post activity counters
+
+Revision ID: 1b7e4c9a3d52
+Revises: e5b9d3f7a240
+Create Date: 2026-10-19 22:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1b7e4c9a3d52'
+down_revision: Union[str, Sequence[str], None] = 'e5b9d3f7a240'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('forum_posts', sa.Column('comments_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('forum_posts', sa.Column('last_activity_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True))
+
+    # Backfill from existing comments
+    op.execute(
+        """
+        UPDATE forum_posts SET
+            comments_count = COALESCE(c.comments, 0),
+            last_activity_at = GREATEST(forum_posts.created_at, c.last_comment_at)
+        FROM (
+            SELECT p.id AS post_id, COUNT(cm.id) AS comments, MAX(cm.created_at) AS last_comment_at
+            FROM forum_posts p
+            LEFT JOIN comments cm ON cm.forum_post_id = p.id
+            GROUP BY p.id
+        ) c
+        WHERE c.post_id = forum_posts.id
+        """
+    )
+    op.create_index(op.f('ix_forum_posts_last_activity_at'), 'forum_posts', ['last_activity_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_forum_posts_last_activity_at'), table_name='forum_posts')
+    op.drop_column('forum_posts', 'last_activity_at')
+    op.drop_column('forum_posts', 'comments_count')
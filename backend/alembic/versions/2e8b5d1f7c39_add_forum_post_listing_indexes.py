@@ -0,0 +1,38 @@
+"""Add forum post listing indexes
+
+Revision ID: 2e8b5d1f7c39
+Revises: 7f3a9e1c4b86
+Create Date: 2026-10-20 01:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2e8b5d1f7c39'
+down_revision: Union[str, Sequence[str], None] = '7f3a9e1c4b86'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Rows created before is_pinned had a value sort as unpinned
+    op.execute("UPDATE forum_posts SET is_pinned = false WHERE is_pinned IS NULL")
+    op.create_index(
+        'ix_forum_posts_pinned_created_id', 'forum_posts',
+        [sa.text('is_pinned DESC'), sa.text('created_at DESC'), sa.text('id DESC')], unique=False
+    )
+    op.create_index(
+        'ix_forum_posts_category_pinned_created_id', 'forum_posts',
+        ['category_id', sa.text('is_pinned DESC'), sa.text('created_at DESC'), sa.text('id DESC')], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_forum_posts_category_pinned_created_id', table_name='forum_posts')
+    op.drop_index('ix_forum_posts_pinned_created_id', table_name='forum_posts')
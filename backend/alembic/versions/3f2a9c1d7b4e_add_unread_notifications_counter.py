@@ -0,0 +1,44 @@
+"""Add unread notifications counter
+
+Revision ID: 3f2a9c1d7b4e
+Revises: 0ed868c0e8a9
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f2a9c1d7b4e'
+down_revision: Union[str, Sequence[str], None] = '0ed868c0e8a9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('notifications', sa.Column('related_id', sa.Integer(), nullable=True))
+    op.add_column('notifications', sa.Column('related_type', sa.String(length=50), nullable=True))
+    op.create_index('ix_notifications_user_id_is_read', 'notifications', ['user_id', 'is_read'], unique=False)
+    op.add_column('users', sa.Column('unread_notifications', sa.Integer(), server_default='0', nullable=False))
+    
+    # Backfill the counter from existing unread notifications
+    op.execute(
+        """
+        UPDATE users SET unread_notifications = (
+            SELECT COUNT(*) FROM notifications
+            WHERE notifications.user_id = users.id AND notifications.is_read = false
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('users', 'unread_notifications')
+    op.drop_index('ix_notifications_user_id_is_read', table_name='notifications')
+    op.drop_column('notifications', 'related_type')
+    op.drop_column('notifications', 'related_id')
@@ -0,0 +1,32 @@
+"""Add badge slug and icon
+
+Revision ID: 4a6c0b8e2d17
+Revises: e19b7f0c4a63
+Create Date: 2026-10-19 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4a6c0b8e2d17'
+down_revision: Union[str, Sequence[str], None] = 'e19b7f0c4a63'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('badges', sa.Column('slug', sa.String(length=100), nullable=True))
+    op.add_column('badges', sa.Column('icon', sa.String(length=100), nullable=True))
+    op.create_index(op.f('ix_badges_slug'), 'badges', ['slug'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_badges_slug'), table_name='badges')
+    op.drop_column('badges', 'icon')
+    op.drop_column('badges', 'slug')
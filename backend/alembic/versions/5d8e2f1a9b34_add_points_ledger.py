@@ -0,0 +1,129 @@
+"""Add points ledger
+
+Revision ID: 5d8e2f1a9b34
+Revises: 4a6c0b8e2d17
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d8e2f1a9b34'
+down_revision: Union[str, Sequence[str], None] = '4a6c0b8e2d17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'points_ledger',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('team_id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=True),
+        sa.Column('entry_type', sa.Enum('AWARD', 'REVERSAL', 'ADJUSTMENT', name='pointsentrytype'), nullable=False),
+        sa.Column('submission_id', sa.Integer(), nullable=True),
+        sa.Column('mission_id', sa.Integer(), nullable=True),
+        sa.Column('reason', sa.Text(), nullable=True),
+        sa.Column('created_by', sa.Integer(), nullable=True),
+        sa.Column('points', sa.Integer(), nullable=False),
+        sa.Column('missions_delta', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['team_id'], ['teams.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='SET NULL'),
+        sa.ForeignKeyConstraint(['submission_id'], ['mission_submissions.id'], ondelete='SET NULL'),
+        sa.ForeignKeyConstraint(['mission_id'], ['missions.id'], ondelete='SET NULL'),
+        sa.ForeignKeyConstraint(['created_by'], ['users.id'], ondelete='SET NULL'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_points_ledger_id'), 'points_ledger', ['id'], unique=False)
+    op.create_index(op.f('ix_points_ledger_user_id'), 'points_ledger', ['user_id'], unique=False)
+    op.create_index(op.f('ix_points_ledger_submission_id'), 'points_ledger', ['submission_id'], unique=False)
+    op.create_index(op.f('ix_points_ledger_created_at'), 'points_ledger', ['created_at'], unique=False)
+    op.create_index('ix_points_ledger_team_id_id', 'points_ledger', ['team_id', 'id'], unique=False)
+
+    op.create_table(
+        'points_checkpoints',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('ledger_id', sa.Integer(), nullable=False),
+        sa.Column('team_id', sa.Integer(), nullable=False),
+        sa.Column('total_points', sa.Integer(), nullable=False),
+        sa.Column('missions_completed', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['team_id'], ['teams.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_points_checkpoints_id'), 'points_checkpoints', ['id'], unique=False)
+    op.create_index(op.f('ix_points_checkpoints_ledger_id'), 'points_checkpoints', ['ledger_id'], unique=False)
+    op.create_index(op.f('ix_points_checkpoints_created_at'), 'points_checkpoints', ['created_at'], unique=False)
+    op.create_index(
+        'ix_points_checkpoints_team_id_ledger_id', 'points_checkpoints',
+        ['team_id', 'ledger_id'], unique=False
+    )
+
+    op.add_column('users', sa.Column('total_points', sa.Integer(), server_default='0', nullable=False))
+
+    # Seed the ledger with one award per already-approved submission, in approval order
+    op.execute(
+        """
+        INSERT INTO points_ledger
+            (team_id, user_id, entry_type, submission_id, mission_id, reason,
+             created_by, points, missions_delta, created_at)
+        SELECT s.team_id, s.submitted_by, 'AWARD', s.id, s.mission_id,
+               'Backfilled from approved submission', s.reviewed_by,
+               m.points, 1, COALESCE(s.reviewed_at, s.submitted_at)
+        FROM mission_submissions s
+        JOIN missions m ON m.id = s.mission_id
+        WHERE s.status = 'APPROVED'
+        ORDER BY COALESCE(s.reviewed_at, s.submitted_at), s.id
+        """
+    )
+
+    # Running totals now come from the ledger
+    op.execute(
+        """
+        UPDATE teams SET
+            total_points = COALESCE(l.points, 0),
+            missions_completed = COALESCE(l.missions, 0)
+        FROM (
+            SELECT t.id AS team_id, SUM(pl.points) AS points, SUM(pl.missions_delta) AS missions
+            FROM teams t
+            LEFT JOIN points_ledger pl ON pl.team_id = t.id
+            GROUP BY t.id
+        ) l
+        WHERE l.team_id = teams.id
+        """
+    )
+    op.execute(
+        """
+        UPDATE users SET total_points = l.points
+        FROM (
+            SELECT user_id, SUM(points) AS points
+            FROM points_ledger
+            WHERE user_id IS NOT NULL
+            GROUP BY user_id
+        ) l
+        WHERE l.user_id = users.id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('users', 'total_points')
+    op.drop_index('ix_points_checkpoints_team_id_ledger_id', table_name='points_checkpoints')
+    op.drop_index(op.f('ix_points_checkpoints_created_at'), table_name='points_checkpoints')
+    op.drop_index(op.f('ix_points_checkpoints_ledger_id'), table_name='points_checkpoints')
+    op.drop_index(op.f('ix_points_checkpoints_id'), table_name='points_checkpoints')
+    op.drop_table('points_checkpoints')
+    op.drop_index('ix_points_ledger_team_id_id', table_name='points_ledger')
+    op.drop_index(op.f('ix_points_ledger_created_at'), table_name='points_ledger')
+    op.drop_index(op.f('ix_points_ledger_submission_id'), table_name='points_ledger')
+    op.drop_index(op.f('ix_points_ledger_user_id'), table_name='points_ledger')
+    op.drop_index(op.f('ix_points_ledger_id'), table_name='points_ledger')
+    op.drop_table('points_ledger')
+    sa.Enum(name='pointsentrytype').drop(op.get_bind(), checkfirst=True)
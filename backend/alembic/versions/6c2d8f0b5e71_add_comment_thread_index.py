@@ -0,0 +1,31 @@
+"""Add comment thread index
+
+Revision ID: 6c2d8f0b5e71
+Revises: 1b7e4c9a3d52
+Create Date: 2026-10-19 23:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6c2d8f0b5e71'
+down_revision: Union[str, Sequence[str], None] = '1b7e4c9a3d52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_comments_forum_post_id_created_at', 'comments',
+        ['forum_post_id', 'created_at'], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_comments_forum_post_id_created_at', table_name='comments')
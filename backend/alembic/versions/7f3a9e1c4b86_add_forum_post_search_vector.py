@@ -0,0 +1,41 @@
+"""Add forum post search vector
+
+Revision ID: 7f3a9e1c4b86
+Revises: 6c2d8f0b5e71
+Create Date: 2026-10-20 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7f3a9e1c4b86'
+down_revision: Union[str, Sequence[str], None] = '6c2d8f0b5e71'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Generated column, so PostgreSQL fills it for existing rows and keeps it current
+    op.execute(
+        """
+        ALTER TABLE forum_posts ADD COLUMN search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('french', coalesce(title, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+            setweight(to_tsvector('french', coalesce(content, '')), 'B') ||
+            setweight(to_tsvector('english', coalesce(content, '')), 'B')
+        ) STORED
+        """
+    )
+    op.execute("CREATE INDEX ix_forum_posts_search_vector ON forum_posts USING gin (search_vector)")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_forum_posts_search_vector', table_name='forum_posts')
+    op.drop_column('forum_posts', 'search_vector')
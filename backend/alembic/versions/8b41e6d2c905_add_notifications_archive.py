@@ -0,0 +1,54 @@
+"""Add notifications archive
+
+Revision ID: 8b41e6d2c905
+Revises: 3f2a9c1d7b4e
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b41e6d2c905'
+down_revision: Union[str, Sequence[str], None] = '3f2a9c1d7b4e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'notifications_archive',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('type', postgresql.ENUM(name='notificationtype', create_type=False), nullable=False),
+        sa.Column('title', sa.String(length=255), nullable=False),
+        sa.Column('message', sa.Text(), nullable=True),
+        sa.Column('related_id', sa.Integer(), nullable=True),
+        sa.Column('related_type', sa.String(length=50), nullable=True),
+        sa.Column('action_url', sa.String(length=500), nullable=True),
+        sa.Column('is_read', sa.Boolean(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('read_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('archived_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(
+        'ix_notifications_archive_user_id_created_at', 'notifications_archive',
+        ['user_id', 'created_at'], unique=False
+    )
+    op.create_index(
+        'ix_notifications_read_created_at', 'notifications', ['created_at'],
+        unique=False, postgresql_where=sa.text('is_read = true')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_notifications_read_created_at', table_name='notifications')
+    op.drop_index('ix_notifications_archive_user_id_created_at', table_name='notifications_archive')
+    op.drop_table('notifications_archive')
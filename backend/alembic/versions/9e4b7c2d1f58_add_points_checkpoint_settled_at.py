@@ -0,0 +1,33 @@
+"""Add points checkpoint settled_at
+
+Revision ID: 9e4b7c2d1f58
+Revises: 5d8e2f1a9b34
+Create Date: 2026-10-19 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9e4b7c2d1f58'
+down_revision: Union[str, Sequence[str], None] = '5d8e2f1a9b34'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('points_checkpoints', sa.Column('settled_at', sa.DateTime(timezone=True), nullable=True))
+    # Existing checkpoints were folded before they were written
+    op.execute("UPDATE points_checkpoints SET settled_at = created_at")
+    op.alter_column('points_checkpoints', 'settled_at', nullable=False)
+    op.create_index(op.f('ix_points_checkpoints_settled_at'), 'points_checkpoints', ['settled_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_points_checkpoints_settled_at'), table_name='points_checkpoints')
+    op.drop_column('points_checkpoints', 'settled_at')
@@ -0,0 +1,35 @@
+"""Add reference data versions
+
+Revision ID: a7e3c1f95d28
+Revises: f2c9b4e7a16d
+Create Date: 2026-10-19 19:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7e3c1f95d28'
+down_revision: Union[str, Sequence[str], None] = 'f2c9b4e7a16d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'reference_data_versions',
+        sa.Column('name', sa.String(length=50), nullable=False),
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.PrimaryKeyConstraint('name')
+    )
+    op.execute("INSERT INTO reference_data_versions (name, version) VALUES ('missions', 1)")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('reference_data_versions')
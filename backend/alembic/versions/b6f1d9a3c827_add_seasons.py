@@ -0,0 +1,65 @@
+"""Add seasons
+
+Revision ID: b6f1d9a3c827
+Revises: 9e4b7c2d1f58
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6f1d9a3c827'
+down_revision: Union[str, Sequence[str], None] = '9e4b7c2d1f58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'seasons',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(length=255), nullable=False),
+        sa.Column('starts_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('ends_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('is_active', sa.Boolean(), nullable=True),
+        sa.Column('closed_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_seasons_id'), 'seasons', ['id'], unique=False)
+    op.create_index(op.f('ix_seasons_starts_at'), 'seasons', ['starts_at'], unique=False)
+    op.create_index(op.f('ix_seasons_is_active'), 'seasons', ['is_active'], unique=False)
+
+    op.create_table(
+        'season_standings',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('season_id', sa.Integer(), nullable=False),
+        sa.Column('team_id', sa.Integer(), nullable=False),
+        sa.Column('team_name', sa.String(length=255), nullable=False),
+        sa.Column('school_name', sa.String(length=255), nullable=True),
+        sa.Column('rank', sa.Integer(), nullable=False),
+        sa.Column('total_points', sa.Integer(), nullable=False),
+        sa.Column('missions_completed', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['season_id'], ['seasons.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_season_standings_id'), 'season_standings', ['id'], unique=False)
+    op.create_index(op.f('ix_season_standings_team_id'), 'season_standings', ['team_id'], unique=False)
+    op.create_index('ix_season_standings_season_id_rank', 'season_standings', ['season_id', 'rank'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_season_standings_season_id_rank', table_name='season_standings')
+    op.drop_index(op.f('ix_season_standings_team_id'), table_name='season_standings')
+    op.drop_index(op.f('ix_season_standings_id'), table_name='season_standings')
+    op.drop_table('season_standings')
+    op.drop_index(op.f('ix_seasons_is_active'), table_name='seasons')
+    op.drop_index(op.f('ix_seasons_starts_at'), table_name='seasons')
+    op.drop_index(op.f('ix_seasons_id'), table_name='seasons')
+    op.drop_table('seasons')
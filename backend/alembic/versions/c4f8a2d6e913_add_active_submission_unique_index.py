@@ -0,0 +1,50 @@
+"""Add active submission unique index
+
+Revision ID: c4f8a2d6e913
+Revises: a7e3c1f95d28
+Create Date: 2026-10-19 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4f8a2d6e913'
+down_revision: Union[str, Sequence[str], None] = 'a7e3c1f95d28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Resolve duplicates left by the old check-then-insert race: a pending
+    # submission is redundant if the team already has an approved one or an
+    # older pending one for the same mission
+    op.execute(
+        """
+        UPDATE mission_submissions s
+        SET status = 'REJECTED',
+            review_comment = 'Duplicate submission',
+            reviewed_at = now()
+        WHERE s.status = 'PENDING'
+          AND EXISTS (
+              SELECT 1 FROM mission_submissions o
+              WHERE o.mission_id = s.mission_id
+                AND o.team_id = s.team_id
+                AND (o.status = 'APPROVED' OR (o.status = 'PENDING' AND o.id < s.id))
+          )
+        """
+    )
+    op.create_index(
+        'uq_mission_submissions_active_team_mission', 'mission_submissions',
+        ['mission_id', 'team_id'], unique=True,
+        postgresql_where=sa.text("status IN ('PENDING', 'APPROVED')")
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('uq_mission_submissions_active_team_mission', table_name='mission_submissions')
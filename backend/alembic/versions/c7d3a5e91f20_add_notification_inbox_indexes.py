@@ -0,0 +1,37 @@
+"""Add notification inbox indexes
+
+Revision ID: c7d3a5e91f20
+Revises: 8b41e6d2c905
+Create Date: 2026-10-19 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7d3a5e91f20'
+down_revision: Union[str, Sequence[str], None] = '8b41e6d2c905'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_notifications_user_created_id', 'notifications',
+        ['user_id', sa.text('created_at DESC'), sa.text('id DESC')], unique=False
+    )
+    op.create_index(
+        'ix_notifications_unread_user_created_id', 'notifications',
+        ['user_id', sa.text('created_at DESC'), sa.text('id DESC')], unique=False,
+        postgresql_where=sa.text('is_read = false')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_notifications_unread_user_created_id', table_name='notifications')
+    op.drop_index('ix_notifications_user_created_id', table_name='notifications')
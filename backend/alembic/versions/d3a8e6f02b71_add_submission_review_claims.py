@@ -0,0 +1,41 @@
+"""Add submission review claims
+
+Revision ID: d3a8e6f02b71
+Revises: b6f1d9a3c827
+Create Date: 2026-10-19 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd3a8e6f02b71'
+down_revision: Union[str, Sequence[str], None] = 'b6f1d9a3c827'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('mission_submissions', sa.Column('claimed_by', sa.Integer(), nullable=True))
+    op.add_column('mission_submissions', sa.Column('claim_expires_at', sa.DateTime(timezone=True), nullable=True))
+    op.create_foreign_key(
+        'fk_mission_submissions_claimed_by_users', 'mission_submissions', 'users',
+        ['claimed_by'], ['id'], ondelete='SET NULL'
+    )
+    op.create_index(
+        'ix_mission_submissions_pending_queue', 'mission_submissions',
+        ['submitted_at', 'id'], unique=False,
+        postgresql_where=sa.text("status = 'PENDING'")
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_mission_submissions_pending_queue', table_name='mission_submissions')
+    op.drop_constraint('fk_mission_submissions_claimed_by_users', 'mission_submissions', type_='foreignkey')
+    op.drop_column('mission_submissions', 'claim_expires_at')
+    op.drop_column('mission_submissions', 'claimed_by')
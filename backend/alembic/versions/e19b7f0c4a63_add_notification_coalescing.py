@@ -0,0 +1,30 @@
+"""Add notification coalescing
+
+Revision ID: e19b7f0c4a63
+Revises: c7d3a5e91f20
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e19b7f0c4a63'
+down_revision: Union[str, Sequence[str], None] = 'c7d3a5e91f20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('notifications', sa.Column('group_count', sa.Integer(), server_default='1', nullable=False))
+    op.add_column('users', sa.Column('notification_digest', sa.Boolean(), server_default='false', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('users', 'notification_digest')
+    op.drop_column('notifications', 'group_count')
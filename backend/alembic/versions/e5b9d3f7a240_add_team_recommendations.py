@@ -0,0 +1,49 @@
+"""Add team recommendations
+
+Revision ID: e5b9d3f7a240
+Revises: c4f8a2d6e913
+Create Date: 2026-10-19 21:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b9d3f7a240'
+down_revision: Union[str, Sequence[str], None] = 'c4f8a2d6e913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'team_recommendations',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('team_id', sa.Integer(), nullable=False),
+        sa.Column('mission_id', sa.Integer(), nullable=False),
+        sa.Column('rank', sa.Integer(), nullable=False),
+        sa.Column('score', sa.Float(), nullable=False),
+        sa.Column('reason', sa.String(length=30), nullable=False),
+        sa.Column('computed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['team_id'], ['teams.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['mission_id'], ['missions.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_team_recommendations_id'), 'team_recommendations', ['id'], unique=False)
+    op.create_index(op.f('ix_team_recommendations_mission_id'), 'team_recommendations', ['mission_id'], unique=False)
+    op.create_index(
+        'ix_team_recommendations_team_id_rank', 'team_recommendations',
+        ['team_id', 'rank'], unique=True
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_team_recommendations_team_id_rank', table_name='team_recommendations')
+    op.drop_index(op.f('ix_team_recommendations_mission_id'), table_name='team_recommendations')
+    op.drop_index(op.f('ix_team_recommendations_id'), table_name='team_recommendations')
+    op.drop_table('team_recommendations')
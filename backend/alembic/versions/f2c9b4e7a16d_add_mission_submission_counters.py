@@ -0,0 +1,47 @@
+"""Add mission submission counters
+
+Revision ID: f2c9b4e7a16d
+Revises: d3a8e6f02b71
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2c9b4e7a16d'
+down_revision: Union[str, Sequence[str], None] = 'd3a8e6f02b71'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('missions', sa.Column('submission_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('missions', sa.Column('approved_count', sa.Integer(), server_default='0', nullable=False))
+
+    # Backfill from existing submissions
+    op.execute(
+        """
+        UPDATE missions SET
+            submission_count = c.submissions,
+            approved_count = c.approved
+        FROM (
+            SELECT mission_id,
+                   COUNT(*) AS submissions,
+                   COUNT(*) FILTER (WHERE status = 'APPROVED') AS approved
+            FROM mission_submissions
+            GROUP BY mission_id
+        ) c
+        WHERE c.mission_id = missions.id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('missions', 'approved_count')
+    op.drop_column('missions', 'submission_count')
@@ -26,6 +26,7 @@ from app.schemas.admin import (
 )
 from app.schemas.user import UserResponse
 from app.schemas.team import TeamResponse
+from app.services.points_service import PointsService
 
 router = APIRouter(tags=["Admin"], dependencies=[Depends(require_admin)])
 
@@ -416,6 +417,21 @@ async def update_team_admin(
     
     # Update fields
     update_data = team_data.model_dump(exclude_unset=True)
+    
+    # Point totals are derived from the ledger: record an adjustment instead of overwriting
+    new_points = update_data.pop("total_points", None)
+    new_missions = update_data.pop("missions_completed", None)
+    points_delta = new_points - team.total_points if new_points is not None else 0
+    missions_delta = new_missions - team.missions_completed if new_missions is not None else 0
+    if points_delta or missions_delta:
+        PointsService(db).adjust_team(
+            team.id,
+            points=points_delta,
+            missions_delta=missions_delta,
+            reason="Admin team update",
+            created_by=current_user.id
+        )
+    
     for field, value in update_data.items():
         setattr(team, field, value)
     
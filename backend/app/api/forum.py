@@ -3,94 +3,160 @@ Forum API
 Community discussion forum endpoints
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
-from typing import List, Optional
+from sqlalchemy import desc, func, case, cast, literal_column, tuple_
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from typing import Dict, List, Optional, Tuple
+from collections import defaultdict
+from datetime import datetime
 
+from app.core.config import settings
 from app.core.database import get_db
 from app.core.dependencies import get_current_user, require_admin
 from app.models.user import User
 from app.models.forum import ForumPost, Comment
-from app.models.category import Category
+from app.services.reference_cache import reference_cache
+from app.services.counter_buffer import counter_buffer
 from app.schemas.forum import (
     ForumPostCreate, ForumPostUpdate, ForumPostResponse, ForumPostWithAuthor,
     CommentCreate, CommentUpdate, CommentResponse, CommentWithAuthor
 )
 from app.schemas.user import UserSummary
+from app.utils.pagination import decode_cursor, encode_cursor, NEXT_CURSOR_HEADER
 
 router = APIRouter(tags=["Forum"])
 
 
+# Languages searched by forum full-text search (see FORUM_POST_SEARCH_VECTOR)
+_SEARCH_CONFIGS = ("french", "english")
+_HEADLINE_OPTIONS = "MaxFragments=2, MaxWords=30, MinWords=10, StartSel=<b>, StopSel=</b>"
+_SNIPPET_CONTEXT = 80
+
+
+def _post_with_author(post: ForumPost, author: User, snippet: Optional[str] = None) -> ForumPostWithAuthor:
+    """Build a post response from a post and its already-loaded author"""
+    return ForumPostWithAuthor(
+        **ForumPostResponse.model_validate(post).model_dump(),
+        author=UserSummary.model_validate(author),
+        comments_count=post.comments_count,
+        snippet=snippet
+    )
+
+
+def _full_text_search(query, search: str):
+    """
+    Filter and rank posts with the PostgreSQL search_vector column.
+    
+    Returns:
+        Query ordered by relevance, with a highlighted snippet column added
+    """
+    ts_query = None
+    for config in _SEARCH_CONFIGS:
+        language_query = func.websearch_to_tsquery(cast(config, REGCONFIG), search)
+        ts_query = language_query if ts_query is None else ts_query.op("||")(language_query)
+    
+    search_vector = literal_column("forum_posts.search_vector")
+    snippet = func.ts_headline(
+        cast(_SEARCH_CONFIGS[0], REGCONFIG), ForumPost.content, ts_query, _HEADLINE_OPTIONS
+    ).label("snippet")
+    
+    return query.add_columns(snippet).filter(
+        search_vector.op("@@")(ts_query)
+    ).order_by(
+        desc(func.ts_rank(search_vector, ts_query)),
+        desc(ForumPost.created_at)
+    )
+
+
+def _highlight(text: str, search: str) -> str:
+    """Fallback snippet: the first match in its surrounding text, marked like ts_headline"""
+    index = text.lower().find(search.lower())
+    if index < 0:
+        return text[:2 * _SNIPPET_CONTEXT]
+    end = index + len(search)
+    return (
+        text[max(0, index - _SNIPPET_CONTEXT):index]
+        + "<b>" + text[index:end] + "</b>"
+        + text[end:end + _SNIPPET_CONTEXT]
+    )
+
+
 @router.get("/posts", response_model=List[ForumPostWithAuthor])
 async def list_forum_posts(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
     category_id: Optional[int] = None,
     search: Optional[str] = None,
+    cursor: Optional[str] = Query(None, description="Keyset cursor from the X-Next-Cursor header"),
     db: Session = Depends(get_db)
 ):
     """
     List all forum posts with optional filters.
     
-    - **skip**: Pagination offset
+    - **skip**: Pagination offset (ignored when a cursor is given)
     - **limit**: Number of posts per page
     - **category_id**: Filter by category
-    - **search**: Search in title and content
+    - **search**: Full-text search in title and content (French and English),
+      ordered by relevance with a highlighted snippet
+    - **cursor**: Resume after the last post of the previous page
+      (not available with search)
+    
+    Authors are joined in and comment counts are stored on the post,
+    so a page is a single query. Without search, a full page sets the
+    `X-Next-Cursor` header; cursor pages seek on (is_pinned, created_at, id),
+    so deep pages cost the same as the first one.
     """
-    query = db.query(ForumPost)
+    if cursor and search:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cursor pagination is not available for search results"
+        )
+    
+    query = db.query(ForumPost, User).join(User, ForumPost.author_id == User.id)
     
     # Apply filters
     if category_id:
         query = query.filter(ForumPost.category_id == category_id)
     
+    if search and db.get_bind().dialect.name == "postgresql":
+        posts = _full_text_search(query, search).offset(skip).limit(limit).all()
+        return [_post_with_author(post, author, snippet) for post, author, snippet in posts]
+    
     if search:
+        # Substring match for databases without full-text search (e.g. SQLite test runs)
         search_term = f"%{search}%"
-        query = query.filter(
+        posts = query.filter(
             (ForumPost.title.ilike(search_term)) |
             (ForumPost.content.ilike(search_term))
+        ).order_by(
+            case((ForumPost.title.ilike(search_term), 0), else_=1),
+            desc(ForumPost.created_at)
+        ).offset(skip).limit(limit).all()
+        return [_post_with_author(post, author, _highlight(post.content, search)) for post, author in posts]
+    
+    if cursor:
+        is_pinned, created_at, post_id = decode_cursor(cursor, (bool, datetime, int))
+        query = query.filter(
+            tuple_(ForumPost.is_pinned, ForumPost.created_at, ForumPost.id) < (is_pinned, created_at, post_id)
         )
     
     # Order: pinned first, then by creation date
-    posts = query.order_by(
+    query = query.order_by(
         desc(ForumPost.is_pinned),
-        desc(ForumPost.created_at)
-    ).offset(skip).limit(limit).all()
-    
-    # Build response with author info and comment count
-    result = []
-    for post in posts:
-        # Get author
-        author = db.query(User).filter(User.id == post.author_id).first()
-        author_summary = UserSummary(
-            id=author.id,
-            username=author.username,
-            full_name=author.full_name,
-            avatar_url=author.avatar_url,
-            role=author.role
-        ) if author else None
-        
-        # Count comments
-        comment_count = db.query(Comment).filter(
-            Comment.forum_post_id == post.id
-        ).count()
-        
-        result.append(ForumPostWithAuthor(
-            id=post.id,
-            title=post.title,
-            content=post.content,
-            category_id=post.category_id,
-            author_id=post.author_id,
-            is_pinned=post.is_pinned,
-            is_locked=post.is_locked,
-            views=post.views,
-            created_at=post.created_at,
-            updated_at=post.updated_at,
-            author=author_summary,
-            comments_count=comment_count
-        ))
+        desc(ForumPost.created_at),
+        desc(ForumPost.id)
+    )
+    if not cursor:
+        query = query.offset(skip)
+    posts = query.limit(limit).all()
     
-    return result
+    if len(posts) == limit:
+        last = posts[-1][0]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor([last.is_pinned, last.created_at, last.id])
+    
+    return [_post_with_author(post, author) for post, author in posts]
 
 
 @router.post("/posts", response_model=ForumPostResponse, status_code=status.HTTP_201_CREATED)
@@ -106,9 +172,7 @@ async def create_forum_post(
     """
     # Verify category if provided
     if post_data.category_id:
-        category = db.query(Category).filter(
-            Category.id == post_data.category_id
-        ).first()
+        category = reference_cache.get_category(db, post_data.category_id)
         if not category:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -143,47 +207,23 @@ async def get_forum_post(
     
     Increments view count when accessed.
     """
-    post = db.query(ForumPost).filter(ForumPost.id == post_id).first()
+    row = db.query(ForumPost, User).join(
+        User, ForumPost.author_id == User.id
+    ).filter(ForumPost.id == post_id).first()
     
-    if not post:
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Forum post not found"
         )
+    post, author = row
     
-    # Increment view count
-    post.views += 1
-    db.commit()
-    
-    # Get author
-    author = db.query(User).filter(User.id == post.author_id).first()
-    author_summary = UserSummary(
-        id=author.id,
-        username=author.username,
-        full_name=author.full_name,
-        avatar_url=author.avatar_url,
-        role=author.role
-    ) if author else None
-    
-    # Count comments
-    comment_count = db.query(Comment).filter(
-        Comment.forum_post_id == post.id
-    ).count()
+    # Increment view count (buffered; written by the counter flush job)
+    counter_buffer.increment(ForumPost, "views", post.id)
     
-    return ForumPostWithAuthor(
-        id=post.id,
-        title=post.title,
-        content=post.content,
-        category_id=post.category_id,
-        author_id=post.author_id,
-        is_pinned=post.is_pinned,
-        is_locked=post.is_locked,
-        views=post.views,
-        created_at=post.created_at,
-        updated_at=post.updated_at,
-        author=author_summary,
-        comments_count=comment_count
-    )
+    response = _post_with_author(post, author)
+    response.views = (post.views or 0) + counter_buffer.pending(ForumPost, "views", post.id)
+    return response
 
 
 @router.put("/posts/{post_id}", response_model=ForumPostResponse)
@@ -275,91 +315,135 @@ async def delete_forum_post(
 
 
 # Comment endpoints
+def _load_thread(db: Session, post_id: int) -> Dict[Optional[int], List[Tuple[Comment, User]]]:
+    """
+    Load every comment of a post with its author in one scan.
+    
+    Returns:
+        Comments grouped by parent comment ID (None for top-level), oldest first
+    """
+    rows = db.query(Comment, User).join(
+        User, Comment.author_id == User.id
+    ).filter(
+        Comment.forum_post_id == post_id
+    ).order_by(Comment.created_at, Comment.id).all()
+    
+    children = defaultdict(list)
+    for comment, author in rows:
+        children[comment.parent_comment_id].append((comment, author))
+    return children
+
+
+def _build_comment_tree(
+    children: Dict[Optional[int], List[Tuple[Comment, User]]],
+    root_id: Optional[int],
+    skip: int = 0,
+    limit: Optional[int] = None,
+    replies_limit: Optional[int] = None,
+    max_depth: Optional[int] = None
+) -> List[CommentWithAuthor]:
+    """
+    Assemble the comments under root_id into nested responses.
+    
+    Iterative, so deep threads cannot hit the recursion limit, and O(n) in
+    the number of comments returned.
+    
+    Args:
+        children: Output of _load_thread
+        root_id: Parent whose replies form the first level (None for the post)
+        skip: First-level comments to skip
+        limit: Maximum first-level comments (None for all)
+        replies_limit: Maximum replies per comment below the first level
+        max_depth: Reply levels to include below the first (None for all)
+    """
+    result: List[CommentWithAuthor] = []
+    pending = [(root_id, 0, result, skip, limit)]
+    
+    while pending:
+        parent_id, depth, target, offset, count = pending.pop()
+        siblings = children.get(parent_id, [])
+        page = siblings[offset:offset + count] if count is not None else siblings[offset:]
+        
+        for comment, author in page:
+            node = CommentWithAuthor(
+                **CommentResponse.model_validate(comment).model_dump(),
+                author=UserSummary.model_validate(author),
+                replies=[],
+                replies_count=len(children.get(comment.id, ()))
+            )
+            target.append(node)
+            if max_depth is None or depth < max_depth:
+                pending.append((comment.id, depth + 1, node.replies, 0, replies_limit))
+    
+    return result
+
+
 @router.get("/posts/{post_id}/comments", response_model=List[CommentWithAuthor])
 async def get_post_comments(
     post_id: int,
+    skip: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=1, le=500),
+    replies_limit: Optional[int] = Query(None, ge=0, le=500),
+    max_depth: Optional[int] = Query(None, ge=0, le=settings.FORUM_THREAD_MAX_DEPTH),
     db: Session = Depends(get_db)
 ):
     """
     Get all comments for a forum post.
     
-    Returns comments with author information and nested replies.
+    Returns comments with author information and nested replies. The whole
+    thread is read in a single query and assembled in memory.
+    
+    - **skip**: Top-level comments to skip
+    - **limit**: Maximum top-level comments to return
+    - **replies_limit**: Maximum replies returned under each comment
+    - **max_depth**: Reply levels to include (0 returns top-level comments only,
+      defaults to and is capped at FORUM_THREAD_MAX_DEPTH)
+    
+    replies_count on each comment tells whether more replies can be loaded
+    from /comments/{comment_id}/replies.
     """
     # Verify post exists
-    post = db.query(ForumPost).filter(ForumPost.id == post_id).first()
+    post = db.query(ForumPost.id).filter(ForumPost.id == post_id).first()
     if not post:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Forum post not found"
         )
     
-    # Get top-level comments (no parent)
-    comments = db.query(Comment).filter(
-        Comment.forum_post_id == post_id,
-        Comment.parent_comment_id == None
-    ).order_by(Comment.created_at).all()
-    
-    result = []
-    for comment in comments:
-        author = db.query(User).filter(User.id == comment.author_id).first()
-        author_summary = UserSummary(
-            id=author.id,
-            username=author.username,
-            full_name=author.full_name,
-            avatar_url=author.avatar_url,
-            role=author.role
-        ) if author else None
-        
-        # Get replies
-        replies = get_comment_replies(comment.id, db)
-        
-        result.append(CommentWithAuthor(
-            id=comment.id,
-            content=comment.content,
-            author_id=comment.author_id,
-            forum_post_id=comment.forum_post_id,
-            parent_comment_id=comment.parent_comment_id,
-            created_at=comment.created_at,
-            updated_at=comment.updated_at,
-            author=author_summary,
-            replies=replies
-        ))
-    
-    return result
+    return _build_comment_tree(
+        _load_thread(db, post_id), None,
+        skip=skip, limit=limit, replies_limit=replies_limit,
+        max_depth=settings.FORUM_THREAD_MAX_DEPTH if max_depth is None else max_depth
+    )
 
 
-def get_comment_replies(comment_id: int, db: Session) -> List[CommentWithAuthor]:
-    """Helper function to recursively get comment replies"""
-    replies = db.query(Comment).filter(
-        Comment.parent_comment_id == comment_id
-    ).order_by(Comment.created_at).all()
-    
-    result = []
-    for reply in replies:
-        author = db.query(User).filter(User.id == reply.author_id).first()
-        author_summary = UserSummary(
-            id=author.id,
-            username=author.username,
-            full_name=author.full_name,
-            avatar_url=author.avatar_url,
-            role=author.role
-        ) if author else None
-        
-        nested_replies = get_comment_replies(reply.id, db)
-        
-        result.append(CommentWithAuthor(
-            id=reply.id,
-            content=reply.content,
-            author_id=reply.author_id,
-            forum_post_id=reply.forum_post_id,
-            parent_comment_id=reply.parent_comment_id,
-            created_at=reply.created_at,
-            updated_at=reply.updated_at,
-            author=author_summary,
-            replies=nested_replies
-        ))
+@router.get("/comments/{comment_id}/replies", response_model=List[CommentWithAuthor])
+async def get_comment_replies(
+    comment_id: int,
+    skip: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=1, le=500),
+    replies_limit: Optional[int] = Query(None, ge=0, le=500),
+    max_depth: Optional[int] = Query(None, ge=0, le=settings.FORUM_THREAD_MAX_DEPTH),
+    db: Session = Depends(get_db)
+):
+    """
+    Get the replies under a comment, for expanding a truncated thread.
     
-    return result
+    Takes the same paging options as the post comments listing, with the
+    comment's direct replies as the first level.
+    """
+    comment = db.query(Comment.id, Comment.forum_post_id).filter(Comment.id == comment_id).first()
+    if not comment:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Comment not found"
+        )
+    
+    return _build_comment_tree(
+        _load_thread(db, comment.forum_post_id), comment_id,
+        skip=skip, limit=limit, replies_limit=replies_limit,
+        max_depth=settings.FORUM_THREAD_MAX_DEPTH if max_depth is None else max_depth
+    )
 
 
 @router.post("/posts/{post_id}/comments", response_model=CommentResponse, status_code=status.HTTP_201_CREATED)
@@ -408,6 +492,10 @@ async def create_comment(
     )
     
     db.add(db_comment)
+    db.query(ForumPost).filter(ForumPost.id == post_id).update({
+        ForumPost.comments_count: ForumPost.comments_count + 1,
+        ForumPost.last_activity_at: func.now()
+    }, synchronize_session=False)
     db.commit()
     db.refresh(db_comment)
     
@@ -475,6 +563,11 @@ async def delete_comment(
             detail="Not authorized to delete this comment"
         )
     
+    # Replies are kept and re-parented to the top level by the ORM
+    if comment.forum_post_id is not None:
+        db.query(ForumPost).filter(ForumPost.id == comment.forum_post_id).update({
+            ForumPost.comments_count: ForumPost.comments_count - 1
+        }, synchronize_session=False)
     db.delete(comment)
     db.commit()
     
@@ -6,22 +6,25 @@ Real-time leaderboard with ranking calculation and SSE updates
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc
+from sqlalchemy import func, desc, insert
 from typing import List, Optional, AsyncGenerator
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import json
 import asyncio
 
 from app.core.database import get_db
-from app.core.dependencies import get_current_user
+from app.core.dependencies import get_current_user, require_admin
 from app.models.user import User
 from app.models.team import Team
 from app.models.school import School
-from app.models.mission import MissionSubmission, MissionStatus
 from app.models.leaderboard import LeaderboardSnapshot
+from app.models.points import PointsLedgerEntry
+from app.models.season import Season, SeasonStanding
+from app.services.points_service import PointsService
 from app.schemas.leaderboard import (
     LeaderboardEntry, LeaderboardResponse, TeamRankHistory, 
-    RankSnapshot, LeaderboardStats
+    RankSnapshot, LeaderboardStats, SeasonCreate, SeasonResponse,
+    SeasonLeaderboardResponse
 )
 
 router = APIRouter(tags=["Leaderboard"])
@@ -37,11 +40,20 @@ _leaderboard_cache = {
 _sse_clients = []
 
 
+def _to_naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Normalise a datetime to naive UTC, the convention used for comparisons here"""
+    if value is not None and value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
 def calculate_leaderboard(
     db: Session,
     school_id: Optional[int] = None,
     category_id: Optional[int] = None,
-    days: Optional[int] = None
+    days: Optional[int] = None,
+    as_of: Optional[datetime] = None,
+    since: Optional[datetime] = None
 ) -> List[LeaderboardEntry]:
     """
     Calculate leaderboard rankings with optional filters.
@@ -50,58 +62,89 @@ def calculate_leaderboard(
         db: Database session
         school_id: Filter by school
         category_id: Filter by mission category
-        days: Filter by time period (e.g., last 30 days)
+        days: Filter by time period (e.g., last 30 days, by approval time)
+        as_of: Rank teams as they stood at this point in time (naive UTC)
+        since: Only count points earned from this point in time (e.g. season start)
+    
+    Totals come from the points ledger: all-time boards read the running
+    totals on Team, windowed boards sum ledger entries in the window, and
+    as-of/since boards start from the nearest points checkpoints.
     
     Returns:
         List of LeaderboardEntry objects sorted by total_points
     """
-    # Import Mission model
-    from app.models.mission import Mission
-    
-    # Base query: aggregate approved submissions by team
-    query = db.query(
-        Team.id.label('team_id'),
-        Team.name.label('team_name'),
-        School.name.label('school_name'),
-        func.coalesce(func.sum(Mission.points), 0).label('total_points'),
-        func.count(MissionSubmission.id).label('missions_completed'),
-        func.count(MissionSubmission.id).label('approved_submissions')
-    ).join(
-        MissionSubmission, Team.id == MissionSubmission.team_id
-    ).join(
-        Mission, MissionSubmission.mission_id == Mission.id
-    ).outerjoin(
-        School, Team.school_id == School.id
-    ).filter(
-        MissionSubmission.status == MissionStatus.APPROVED
-    ).group_by(
-        Team.id, Team.name, School.name
-    )
+    totals = None
+    if days:
+        # Windowed board: aggregate only the ledger entries recorded in range
+        window_end = as_of or datetime.utcnow()
+        cutoff_date = window_end - timedelta(days=days)
+        window = db.query(
+            PointsLedgerEntry.team_id.label('team_id'),
+            func.sum(PointsLedgerEntry.points).label('total_points'),
+            func.sum(PointsLedgerEntry.missions_delta).label('missions_completed')
+        ).filter(
+            PointsLedgerEntry.created_at >= cutoff_date
+        )
+        if as_of:
+            window = window.filter(PointsLedgerEntry.created_at <= as_of)
+        totals = window.group_by(PointsLedgerEntry.team_id).subquery()
+    elif since:
+        # Period board (e.g. a season): difference of two point-in-time totals
+        totals = PointsService(db).team_totals_between(since, as_of)
+    elif as_of:
+        # Point-in-time board: checkpoint plus the ledger entries since it
+        totals = PointsService(db).team_totals_as_of(as_of)
+    
+    if totals is not None:
+        query = db.query(
+            Team.id.label('team_id'),
+            Team.name.label('team_name'),
+            School.name.label('school_name'),
+            totals.c.total_points,
+            totals.c.missions_completed
+        ).join(
+            totals, Team.id == totals.c.team_id
+        ).outerjoin(
+            School, Team.school_id == School.id
+        ).filter(
+            (totals.c.total_points != 0) | (totals.c.missions_completed > 0)
+        )
+    else:
+        # All-time board: read the running totals maintained alongside the ledger
+        query = db.query(
+            Team.id.label('team_id'),
+            Team.name.label('team_name'),
+            School.name.label('school_name'),
+            Team.total_points.label('total_points'),
+            Team.missions_completed.label('missions_completed')
+        ).outerjoin(
+            School, Team.school_id == School.id
+        ).filter(
+            (Team.total_points != 0) | (Team.missions_completed > 0)
+        )
     
     # Apply filters
     if school_id:
         query = query.filter(Team.school_id == school_id)
     
-    if days:
-        cutoff_date = datetime.utcnow() - timedelta(days=days)
-        query = query.filter(MissionSubmission.submitted_at >= cutoff_date)
-    
     # Execute query and get results
-    results = query.order_by(desc('total_points')).all()
+    results = query.order_by(desc('total_points'), Team.id).all()
     
     # Convert to leaderboard entries with rankings
     entries = []
     for rank, row in enumerate(results, start=1):
-        avg_score = row.total_points / row.missions_completed if row.missions_completed > 0 else 0.0
+        total_points = int(row.total_points or 0)
+        missions_completed = int(row.missions_completed or 0)
+        avg_score = total_points / missions_completed if missions_completed > 0 else 0.0
         
         entries.append(LeaderboardEntry(
             rank=rank,
             team_id=row.team_id,
             team_name=row.team_name,
             school_name=row.school_name,
-            total_points=row.total_points,
-            missions_completed=row.missions_completed,
-            approved_submissions=row.approved_submissions,
+            total_points=total_points,
+            missions_completed=missions_completed,
+            approved_submissions=missions_completed,
             average_score=round(avg_score, 2),
             rank_change=0  # Calculate from historical data if available
         ))
@@ -116,24 +159,34 @@ async def get_leaderboard(
     school_id: Optional[int] = Query(None, description="Filter by school ID"),
     category_id: Optional[int] = Query(None, description="Filter by mission category"),
     days: Optional[int] = Query(None, ge=1, description="Filter by days (e.g., 30 for last 30 days)"),
+    as_of: Optional[datetime] = Query(None, description="Show rankings as they stood at this date/time"),
     db: Session = Depends(get_db)
 ):
     """
-    Get current leaderboard rankings with optional filters.
+    Get leaderboard rankings with optional filters.
     
     - **skip**: Pagination offset
     - **limit**: Number of entries per page
     - **school_id**: Filter by specific school
     - **category_id**: Filter by mission category
-    - **days**: Filter by time period (last N days)
+    - **days**: Filter by time period (last N days, ending at as_of if given)
+    - **as_of**: Point in time to rank at (ISO 8601, UTC if no offset)
     
     Uses caching for better performance.
     """
     # Check cache (only for unfiltered requests)
-    cache_key = f"leaderboard_{school_id}_{category_id}_{days}"
+    cache_key = f"leaderboard_{school_id}_{category_id}_{days}_{as_of}"
     now = datetime.utcnow()
     
-    if not school_id and not category_id and not days:
+    if as_of is not None:
+        as_of = _to_naive_utc(as_of)
+        if as_of > now:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="as_of cannot be in the future"
+            )
+    
+    if not school_id and not category_id and not days and not as_of:
         if (_leaderboard_cache["data"] and _leaderboard_cache["timestamp"] and
             (now - _leaderboard_cache["timestamp"]).seconds < _leaderboard_cache["ttl"]):
             cached_data = _leaderboard_cache["data"]
@@ -145,10 +198,10 @@ async def get_leaderboard(
             )
     
     # Calculate fresh leaderboard
-    entries = calculate_leaderboard(db, school_id, category_id, days)
+    entries = calculate_leaderboard(db, school_id, category_id, days, as_of)
     
     # Update cache if no filters
-    if not school_id and not category_id and not days:
+    if not school_id and not category_id and not days and not as_of:
         _leaderboard_cache["data"] = entries
         _leaderboard_cache["timestamp"] = now
     
@@ -160,11 +213,13 @@ async def get_leaderboard(
         filters["category_id"] = category_id
     if days:
         filters["days"] = days
+    if as_of:
+        filters["as_of"] = as_of.isoformat()
     
     return LeaderboardResponse(
         entries=entries[skip:skip + limit],
         total_teams=len(entries),
-        last_updated=now,
+        last_updated=as_of or now,
         filters=filters if filters else None
     )
 
@@ -252,32 +307,18 @@ async def get_leaderboard_stats(
         - Top team info
         - Most active and improved teams
     """
-    # Import Mission model
-    from app.models.mission import Mission
-    
     # Calculate statistics
     total_teams = db.query(func.count(func.distinct(Team.id))).scalar() or 0
     
-    # Total points from approved submissions
-    total_points = db.query(
-        func.sum(Mission.points)
-    ).join(
-        MissionSubmission, Mission.id == MissionSubmission.mission_id
-    ).filter(
-        MissionSubmission.status == MissionStatus.APPROVED
-    ).scalar() or 0
-    
-    total_missions = db.query(func.count(MissionSubmission.id)).filter(
-        MissionSubmission.status == MissionStatus.APPROVED
-    ).scalar() or 0
+    # Totals from the running team counters
+    total_points = db.query(func.sum(Team.total_points)).scalar() or 0
+    total_missions = db.query(func.sum(Team.missions_completed)).scalar() or 0
     
     # Active schools
     active_schools = db.query(
         func.count(func.distinct(Team.school_id))
-    ).join(
-        MissionSubmission, Team.id == MissionSubmission.team_id
     ).filter(
-        MissionSubmission.status == MissionStatus.APPROVED
+        Team.missions_completed > 0
     ).scalar() or 0
     
     # Average team score
@@ -301,6 +342,206 @@ async def get_leaderboard_stats(
     )
 
 
+def _season_live_entries(db: Session, season: Season) -> List[LeaderboardEntry]:
+    """Live standings of a season that has not been closed yet"""
+    ends_at = _to_naive_utc(season.ends_at)
+    if ends_at and ends_at > datetime.utcnow():
+        ends_at = None
+    return calculate_leaderboard(db, since=_to_naive_utc(season.starts_at), as_of=ends_at)
+
+
+@router.get("/seasons", response_model=List[SeasonResponse])
+async def list_seasons(
+    db: Session = Depends(get_db)
+):
+    """
+    List all seasons, most recent first.
+    """
+    return db.query(Season).order_by(Season.starts_at.desc()).all()
+
+
+@router.post("/seasons", response_model=SeasonResponse, status_code=status.HTTP_201_CREATED)
+async def start_season(
+    season_data: SeasonCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_admin)
+):
+    """
+    Start a new season (admin only).
+    
+    Only one season can be active at a time; close the current one first.
+    """
+    active = db.query(Season).filter(Season.is_active == True).first()
+    if active:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Season '{active.name}' is still active"
+        )
+    
+    starts_at = _to_naive_utc(season_data.starts_at) or datetime.utcnow()
+    ends_at = _to_naive_utc(season_data.ends_at)
+    if ends_at and ends_at <= starts_at:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Season must end after it starts"
+        )
+    
+    season = Season(
+        name=season_data.name,
+        starts_at=starts_at,
+        ends_at=ends_at,
+        is_active=True
+    )
+    db.add(season)
+    db.commit()
+    db.refresh(season)
+    
+    return season
+
+
+@router.get("/seasons/current", response_model=SeasonLeaderboardResponse)
+async def get_current_season_leaderboard(
+    skip: int = Query(0, ge=0, description="Number of entries to skip"),
+    limit: int = Query(50, ge=1, le=100, description="Number of entries to return"),
+    db: Session = Depends(get_db)
+):
+    """
+    Get the live leaderboard of the active season.
+    
+    Only points earned since the season started are counted.
+    """
+    season = db.query(Season).filter(Season.is_active == True).first()
+    if not season:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No active season"
+        )
+    
+    entries = _season_live_entries(db, season)
+    
+    return SeasonLeaderboardResponse(
+        season=season,
+        entries=entries[skip:skip + limit],
+        total_teams=len(entries),
+        is_final=False,
+        last_updated=datetime.utcnow()
+    )
+
+
+@router.get("/seasons/{season_id}", response_model=SeasonLeaderboardResponse)
+async def get_season_leaderboard(
+    season_id: int,
+    skip: int = Query(0, ge=0, description="Number of entries to skip"),
+    limit: int = Query(50, ge=1, le=100, description="Number of entries to return"),
+    db: Session = Depends(get_db)
+):
+    """
+    Get a season's leaderboard.
+    
+    Closed seasons are served from their archived final standings; the
+    active season is computed live.
+    """
+    season = db.query(Season).filter(Season.id == season_id).first()
+    if not season:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Season not found"
+        )
+    
+    if season.is_active:
+        entries = _season_live_entries(db, season)
+        return SeasonLeaderboardResponse(
+            season=season,
+            entries=entries[skip:skip + limit],
+            total_teams=len(entries),
+            is_final=False,
+            last_updated=datetime.utcnow()
+        )
+    
+    standings_query = db.query(SeasonStanding).filter(SeasonStanding.season_id == season.id)
+    total_teams = standings_query.count()
+    standings = standings_query.order_by(SeasonStanding.rank).offset(skip).limit(limit).all()
+    
+    entries = [
+        LeaderboardEntry(
+            rank=standing.rank,
+            team_id=standing.team_id,
+            team_name=standing.team_name,
+            school_name=standing.school_name,
+            total_points=standing.total_points,
+            missions_completed=standing.missions_completed,
+            approved_submissions=standing.missions_completed,
+            average_score=round(
+                standing.total_points / standing.missions_completed, 2
+            ) if standing.missions_completed > 0 else 0.0
+        )
+        for standing in standings
+    ]
+    
+    return SeasonLeaderboardResponse(
+        season=season,
+        entries=entries,
+        total_teams=total_teams,
+        is_final=True,
+        last_updated=season.closed_at
+    )
+
+
+@router.post("/seasons/{season_id}/close", response_model=SeasonResponse)
+async def close_season(
+    season_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_admin)
+):
+    """
+    Close a season and freeze its final standings (admin only).
+    
+    The season ends at its planned end if that has passed, otherwise now.
+    Standings are written to the archive in one bulk insert.
+    """
+    # Lock the season so two closes cannot archive it twice
+    season = db.query(Season).filter(Season.id == season_id).with_for_update().first()
+    if not season:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Season not found"
+        )
+    if not season.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Season is already closed"
+        )
+    
+    now = datetime.utcnow()
+    ends_at = _to_naive_utc(season.ends_at)
+    if not ends_at or ends_at > now:
+        ends_at = now
+    
+    entries = calculate_leaderboard(db, since=_to_naive_utc(season.starts_at), as_of=ends_at)
+    rows = [
+        {
+            "season_id": season.id,
+            "team_id": entry.team_id,
+            "team_name": entry.team_name,
+            "school_name": entry.school_name,
+            "rank": entry.rank,
+            "total_points": entry.total_points,
+            "missions_completed": entry.missions_completed
+        }
+        for entry in entries
+    ]
+    if rows:
+        db.execute(insert(SeasonStanding), rows)
+    
+    season.ends_at = ends_at
+    season.is_active = False
+    season.closed_at = now
+    db.commit()
+    db.refresh(season)
+    
+    return season
+
+
 async def leaderboard_event_generator(db: Session) -> AsyncGenerator[str, None]:
     """
     Server-Sent Events generator for real-time leaderboard updates.
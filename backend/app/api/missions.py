@@ -3,28 +3,120 @@ Mission Management API
 Endpoints for mission CRUD, submissions, and approvals
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response, UploadFile, File
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import or_, func, case, select
+from sqlalchemy.exc import IntegrityError
 from typing import List, Optional
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+import csv
 
+from app.core.config import settings
 from app.core.database import get_db
 from app.core.dependencies import get_current_user, require_admin
 from app.models.user import User, UserRole
 from app.models.mission import Mission, MissionSubmission, MissionStatus, MissionDifficulty
 from app.models.team import Team, TeamMember
 from app.models.category import Category
+from app.services.reference_cache import reference_cache
+from app.utils.etag import etag_matches
+from app.schemas.team import TeamSummary
+from app.schemas.user import UserSummary
 from app.schemas.mission import (
     MissionCreate, MissionUpdate, MissionResponse, MissionWithDetails,
     SubmissionCreate, SubmissionUpdate, SubmissionResponse, SubmissionReview,
-    MissionSummary
+    SubmissionBatchReview, SubmissionBatchReviewResult, SubmissionBatchSkip,
+    MissionSummary, MissionCatalogItem, MissionImportResult, MissionRecommendation,
+    SubmissionExpanded
 )
 
 router = APIRouter(tags=["Missions"])
 
+# Best status first when a team has several submissions for one mission
+_TEAM_STATUS_RANK = {
+    MissionStatus.APPROVED: 3,
+    MissionStatus.PENDING: 2,
+    MissionStatus.REJECTED: 1
+}
+_TEAM_STATUS_NAMES = {rank: s.value for s, rank in _TEAM_STATUS_RANK.items()}
+
+
+def _team_status_subquery(team_id: int):
+    """Best submission status per mission for one team, as a rank (see _TEAM_STATUS_RANK)"""
+    return select(
+        MissionSubmission.mission_id,
+        func.max(case(
+            *[(MissionSubmission.status == s, rank) for s, rank in _TEAM_STATUS_RANK.items()],
+            else_=0
+        )).label("status_rank")
+    ).where(
+        MissionSubmission.team_id == team_id
+    ).group_by(MissionSubmission.mission_id).subquery()
+
+
+def _team_status_name(status_rank: Optional[int]) -> str:
+    """Map a status rank back to its catalog name"""
+    return _TEAM_STATUS_NAMES.get(status_rank, "none")
+
+
+# Related objects a submission listing can expand, with their eager loaders.
+# Missions come from the reference data cache instead of a join.
+_SUBMISSION_INCLUDES = {
+    "mission": None,
+    "team": MissionSubmission.team,
+    "submitter": MissionSubmission.submitted_by_user
+}
+
+
+def _parse_submission_include(include: Optional[str]) -> List[str]:
+    """Validate a comma-separated include= value"""
+    if not include:
+        return []
+    names = [name.strip() for name in include.split(",") if name.strip()]
+    unknown = [name for name in names if name not in _SUBMISSION_INCLUDES]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown include: {', '.join(unknown)} (allowed: {', '.join(_SUBMISSION_INCLUDES)})"
+        )
+    return names
+
+
+def _with_submission_includes(query, includes: List[str]):
+    """Eager-load the requested relationships in the listing query itself"""
+    loaders = [joinedload(_SUBMISSION_INCLUDES[name]) for name in includes if _SUBMISSION_INCLUDES[name] is not None]
+    return query.options(*loaders) if loaders else query
+
+
+def _expand_submissions(
+    db: Session,
+    submissions: List[MissionSubmission],
+    includes: List[str]
+) -> List[SubmissionExpanded]:
+    """Serialize submissions with only the requested relationships attached"""
+    missions_by_id = reference_cache.snapshot(db).missions_by_id if "mission" in includes else {}
+    expanded = []
+    for submission in submissions:
+        # Only requested relations are set, so the others stay out of the response
+        related = {}
+        if "mission" in includes:
+            mission = missions_by_id.get(submission.mission_id)
+            related["mission"] = MissionSummary.model_validate(mission) if mission else None
+        if "team" in includes:
+            related["team"] = TeamSummary.model_validate(submission.team)
+        if "submitter" in includes:
+            related["submitter"] = UserSummary.model_validate(submission.submitted_by_user)
+        expanded.append(SubmissionExpanded(
+            **SubmissionResponse.model_validate(submission).model_dump(),
+            **related
+        ))
+    return expanded
+
 
 @router.get("", response_model=List[MissionSummary])
 async def list_missions(
+    request: Request,
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
     category_id: Optional[int] = None,
@@ -35,38 +127,141 @@ async def list_missions(
     """
     List all missions with optional filters.
     
+    Served from the in-memory reference data cache; responses carry an
+    ETag so unchanged listings can be revalidated with If-None-Match.
+    
     - **skip**: Number of missions to skip (pagination)
     - **limit**: Maximum number of missions to return
     - **category_id**: Filter by category ID
     - **difficulty**: Filter by difficulty (EASY, MEDIUM, HARD)
     - **is_active**: Filter by active status (default: True)
     """
-    query = db.query(Mission)
+    snapshot = reference_cache.snapshot(db)
+    etag = snapshot.etag("missions")
+    if etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    
+    missions = [
+        mission for mission in snapshot.missions
+        if (category_id is None or mission["category_id"] == category_id)
+        and (difficulty is None or mission["difficulty"] == difficulty)
+        and (is_active is None or mission["is_active"] == is_active)
+    ]
+    
+    return missions[skip:skip + limit]
+
+
+@router.get("/catalog", response_model=List[MissionCatalogItem])
+async def get_mission_catalog(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=100),
+    category_id: Optional[int] = None,
+    difficulty: Optional[MissionDifficulty] = None,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    List active missions with the current user's team status on each.
     
-    if category_id is not None:
-        query = query.filter(Mission.category_id == category_id)
+    Replaces calling the mission list and my-submissions separately.
+    Missions come from the in-memory reference data cache; the team status
+    comes from one query against the team's submissions for the page.
     
-    if difficulty is not None:
-        query = query.filter(Mission.difficulty == difficulty)
+    - **skip**: Number of missions to skip (pagination)
+    - **limit**: Maximum number of missions to return
+    - **category_id**: Filter by category ID
+    - **difficulty**: Filter by difficulty
     
-    if is_active is not None:
-        query = query.filter(Mission.is_active == is_active)
+    team_status is one of none, pending, approved or rejected.
+    """
+    missions = [
+        mission for mission in reference_cache.snapshot(db).missions
+        if mission["is_active"]
+        and (category_id is None or mission["category_id"] == category_id)
+        and (difficulty is None or mission["difficulty"] == difficulty)
+    ][skip:skip + limit]
+    
+    membership = db.query(TeamMember.team_id).filter(
+        TeamMember.user_id == current_user.id
+    ).first()
     
-    missions = query.order_by(Mission.created_at.desc()).offset(skip).limit(limit).all()
+    status_ranks = {}
+    if membership and missions:
+        team_status = _team_status_subquery(membership.team_id)
+        status_ranks = dict(db.query(team_status.c.mission_id, team_status.c.status_rank).filter(
+            team_status.c.mission_id.in_([mission["id"] for mission in missions])
+        ).all())
+    
+    return [
+        MissionCatalogItem(
+            **MissionSummary.model_validate(mission).model_dump(),
+            team_status=_team_status_name(status_ranks.get(mission["id"]))
+        )
+        for mission in missions
+    ]
+
+
+@router.get("/recommendations", response_model=List[MissionRecommendation])
+async def get_recommended_missions(
+    limit: int = Query(10, ge=1, le=50),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Suggested next missions for the current user's team.
+    
+    Suggestions are precomputed by a periodic job from the team's strong
+    categories, difficulty progression and what similar teams completed;
+    this endpoint only reads them back.
+    
+    - **limit**: Maximum number of suggestions to return
+    
+    Returns 404 if user is not in a team.
+    """
+    # Import services
+    from app.services.recommendation_service import RecommendationService
+    
+    membership = db.query(TeamMember.team_id).filter(
+        TeamMember.user_id == current_user.id
+    ).first()
+    
+    if not membership:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="You are not in any team"
+        )
     
-    return missions
+    snapshot = reference_cache.snapshot(db)
+    recommendations = []
+    for recommendation in RecommendationService(db).get_for_team(membership.team_id, limit):
+        mission = snapshot.missions_by_id.get(recommendation.mission_id)
+        if not mission or not mission["is_active"]:
+            continue
+        recommendations.append(MissionRecommendation(
+            **MissionSummary.model_validate(mission).model_dump(),
+            score=recommendation.score,
+            reason=recommendation.reason
+        ))
+    
+    return recommendations
 
 
-@router.get("/my-submissions", response_model=List[SubmissionResponse])
+@router.get("/my-submissions", response_model=List[SubmissionExpanded], response_model_exclude_unset=True)
 async def get_my_submissions(
+    include: Optional[str] = Query(None, description="Comma-separated: mission, team, submitter"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
     Get all submissions from the current user's team.
     
+    - **include**: Related objects to embed (mission, team, submitter)
+    
     Returns 404 if user is not in a team.
     """
+    includes = _parse_submission_include(include)
+    
     # Check if user is a student
     if current_user.role != UserRole.STUDENT:
         raise HTTPException(
@@ -86,11 +281,69 @@ async def get_my_submissions(
         )
     
     # Get team submissions
-    submissions = db.query(MissionSubmission).filter(
+    submissions = _with_submission_includes(db.query(MissionSubmission), includes).filter(
         MissionSubmission.team_id == membership.team_id
     ).order_by(MissionSubmission.submitted_at.desc()).all()
     
-    return submissions
+    return _expand_submissions(db, submissions, includes)
+
+
+@router.get("/submissions", response_model=List[SubmissionExpanded], response_model_exclude_unset=True)
+async def list_submissions(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=100),
+    mission_id: Optional[int] = None,
+    team_id: Optional[int] = None,
+    status: Optional[MissionStatus] = None,
+    include: Optional[str] = Query(None, description="Comma-separated: mission, team, submitter"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    List mission submissions with filters.
+    
+    Students can only see their team's submissions.
+    Teachers and admins can see all submissions.
+    
+    - **skip**: Number of submissions to skip
+    - **limit**: Maximum number of submissions to return
+    - **mission_id**: Filter by mission ID
+    - **team_id**: Filter by team ID
+    - **status**: Filter by status (PENDING, APPROVED, REJECTED)
+    - **include**: Related objects to embed (mission, team, submitter)
+    
+    Included relationships are loaded in the listing query itself, so a
+    page costs the same number of queries whatever its size.
+    """
+    includes = _parse_submission_include(include)
+    query = _with_submission_includes(db.query(MissionSubmission), includes)
+    
+    # If student, filter to their team only
+    if current_user.role == UserRole.STUDENT:
+        membership = db.query(TeamMember).filter(
+            TeamMember.user_id == current_user.id
+        ).first()
+        
+        if membership:
+            query = query.filter(MissionSubmission.team_id == membership.team_id)
+        else:
+            return []  # No team, no submissions
+    
+    # Apply filters
+    if mission_id is not None:
+        query = query.filter(MissionSubmission.mission_id == mission_id)
+    
+    if team_id is not None:
+        query = query.filter(MissionSubmission.team_id == team_id)
+    
+    if status is not None:
+        query = query.filter(MissionSubmission.status == status)
+    
+    submissions = query.order_by(
+        MissionSubmission.submitted_at.desc()
+    ).offset(skip).limit(limit).all()
+    
+    return _expand_submissions(db, submissions, includes)
 
 
 @router.post("", response_model=MissionResponse, status_code=status.HTTP_201_CREATED)
@@ -153,60 +406,117 @@ async def create_mission(
     )
     
     db.add(db_mission)
+    reference_cache.bump(db)
     db.commit()
     db.refresh(db_mission)
+    reference_cache.invalidate()
     
     return db_mission
 
 
+@router.post("/import", response_model=MissionImportResult)
+async def import_missions(
+    file: UploadFile = File(...),
+    file_format: Optional[str] = Query(None, alias="format", pattern="^(csv|ndjson)$"),
+    on_conflict: str = Query("update", pattern="^(update|skip)$"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Bulk import missions from a CSV or NDJSON file.
+    
+    Only teachers and admins can import missions. The file is parsed
+    row by row and written in batches within a single transaction;
+    invalid rows are reported and skipped.
+    
+    - **file**: CSV with a header row, or one JSON object per line
+    - **format**: csv or ndjson (inferred from the file name if omitted)
+    - **on_conflict**: update or skip missions whose title already exists
+    
+    Each row takes the mission create fields plus optional requirements,
+    instructions and is_active; the category may be given as category_id
+    or as category (slug or name).
+    """
+    # Import services
+    from app.services.mission_service import MissionService, iter_import_rows
+    
+    if current_user.role not in [UserRole.TEACHER, UserRole.ADMIN]:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only teachers and admins can import missions"
+        )
+    
+    if file_format is None:
+        filename = (file.filename or "").lower()
+        if filename.endswith(".csv") or file.content_type == "text/csv":
+            file_format = "csv"
+        elif filename.endswith((".ndjson", ".jsonl")) or file.content_type in ("application/x-ndjson", "application/jsonl"):
+            file_format = "ndjson"
+        else:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Could not infer file format; pass format=csv or format=ndjson"
+            )
+    
+    mission_service = MissionService(db)
+    try:
+        result = mission_service.import_missions(
+            iter_import_rows(file.file, file_format),
+            update_existing=on_conflict == "update"
+        )
+    except (UnicodeDecodeError, csv.Error) as e:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Could not read file: {e}"
+        )
+    
+    if result.created or result.updated:
+        reference_cache.bump(db)
+        db.commit()
+        reference_cache.invalidate()
+    
+    return result
+
+
 @router.get("/{mission_id}", response_model=MissionWithDetails)
 async def get_mission(
     mission_id: int,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db)
 ):
     """
     Get detailed mission information.
     
     - **mission_id**: Mission ID
+    
+    Mission fields come from the reference data cache; only the live
+    submission counters are read from the database.
     """
-    mission = db.query(Mission).filter(Mission.id == mission_id).first()
+    mission = reference_cache.get_mission(db, mission_id)
+    counters = db.query(
+        Mission.submission_count, Mission.approved_count
+    ).filter(Mission.id == mission_id).first() if mission else None
     
-    if not mission:
+    if not mission or not counters:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Mission not found"
         )
     
-    # Get submission count
-    submission_count = db.query(MissionSubmission).filter(
-        MissionSubmission.mission_id == mission_id
-    ).count()
-    
-    # Get approved count
-    approved_count = db.query(MissionSubmission).filter(
-        MissionSubmission.mission_id == mission_id,
-        MissionSubmission.status == MissionStatus.APPROVED
-    ).count()
-    
-    # Convert to dict and add counts
-    mission_dict = {
-        "id": mission.id,
-        "title": mission.title,
-        "description": mission.description,
-        "category_id": mission.category_id,
-        "difficulty": mission.difficulty,
-        "points": mission.points,
-        "requires_photo": mission.requires_photo,
-        "requires_file": mission.requires_file,
-        "requires_description": mission.requires_description,
-        "is_active": mission.is_active,
-        "created_at": mission.created_at,
-        "category": mission.category,
-        "submission_count": submission_count,
-        "approved_count": approved_count
+    etag = reference_cache.snapshot(db).etag(
+        "mission", mission_id, counters.submission_count, counters.approved_count
+    )
+    if etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    
+    return {
+        **mission,
+        "submission_count": counters.submission_count,
+        "approved_count": counters.approved_count
     }
-    
-    return mission_dict
 
 
 @router.put("/{mission_id}", response_model=MissionResponse)
@@ -267,8 +577,10 @@ async def update_mission(
     if mission_data.is_active is not None:
         mission.is_active = mission_data.is_active
     
+    reference_cache.bump(db)
     db.commit()
     db.refresh(mission)
+    reference_cache.invalidate()
     
     return mission
 
@@ -303,7 +615,9 @@ async def delete_mission(
     
     # Delete mission (cascade will handle submissions)
     db.delete(mission)
+    reference_cache.bump(db)
     db.commit()
+    reference_cache.invalidate()
 
 
 @router.post("/{mission_id}/submit", response_model=SubmissionResponse, status_code=status.HTTP_201_CREATED)
@@ -370,19 +684,6 @@ async def submit_mission(
             detail="File is required for this mission"
         )
     
-    # Check if team already has a pending or approved submission for this mission
-    existing_submission = db.query(MissionSubmission).filter(
-        MissionSubmission.mission_id == mission_id,
-        MissionSubmission.team_id == membership.team_id,
-        MissionSubmission.status.in_([MissionStatus.PENDING, MissionStatus.APPROVED])
-    ).first()
-    
-    if existing_submission:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Team already has a {existing_submission.status.value.lower()} submission for this mission"
-        )
-    
     # Create submission
     db_submission = MissionSubmission(
         mission_id=mission_id,
@@ -394,7 +695,28 @@ async def submit_mission(
         status=MissionStatus.PENDING
     )
     
+    # The partial unique index rejects a second pending/approved submission,
+    # so concurrent double submits cannot both get through
     db.add(db_submission)
+    try:
+        db.flush()
+    except IntegrityError:
+        db.rollback()
+        existing_status = db.query(MissionSubmission.status).filter(
+            MissionSubmission.mission_id == mission_id,
+            MissionSubmission.team_id == membership.team_id,
+            MissionSubmission.status.in_([MissionStatus.PENDING, MissionStatus.APPROVED])
+        ).scalar()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Team already has a {(existing_status or MissionStatus.PENDING).value.lower()} submission for this mission"
+        )
+    
+    from app.services.mission_service import MissionService
+    from app.services.recommendation_service import RecommendationService
+    MissionService(db).adjust_counters(mission_id, submissions=1)
+    RecommendationService(db).discard(membership.team_id, mission_id)
+    
     db.commit()
     db.refresh(db_submission)
     
@@ -440,56 +762,242 @@ async def get_submission(
     return submission
 
 
-@router.get("/submissions", response_model=List[SubmissionResponse])
-async def list_submissions(
-    skip: int = Query(0, ge=0),
-    limit: int = Query(100, ge=1, le=100),
-    mission_id: Optional[int] = None,
-    team_id: Optional[int] = None,
-    status: Optional[MissionStatus] = None,
+def _claimed_by_other(submission: MissionSubmission, user_id: int, now: datetime) -> bool:
+    """Check whether another reviewer holds an unexpired claim on a submission"""
+    if submission.claimed_by is None or submission.claimed_by == user_id:
+        return False
+    expires_at = submission.claim_expires_at
+    if expires_at is None:
+        return False
+    if expires_at.tzinfo is not None:
+        expires_at = expires_at.astimezone(timezone.utc).replace(tzinfo=None)
+    return expires_at > now
+
+
+@router.post("/submissions/claim", response_model=List[SubmissionResponse])
+async def claim_submissions(
+    n: int = Query(10, ge=1, le=50, description="Number of submissions to claim"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
-    List mission submissions with filters.
+    Claim the next pending submissions from the review queue.
     
-    Students can only see their team's submissions.
-    Teachers and admins can see all submissions.
+    Hands out the oldest pending submissions that are unclaimed, whose lease
+    has expired, or that the caller already holds (renewing the lease).
+    Rows locked by a concurrent claim are skipped rather than waited on, so
+    reviewers working in parallel never receive the same submission.
     
-    - **skip**: Number of submissions to skip
-    - **limit**: Maximum number of submissions to return
-    - **mission_id**: Filter by mission ID
-    - **team_id**: Filter by team ID
-    - **status**: Filter by status (PENDING, APPROVED, REJECTED)
+    - **n**: How many submissions to claim (max 50)
     """
-    query = db.query(MissionSubmission)
+    # Check if user is teacher or admin
+    if current_user.role not in [UserRole.TEACHER, UserRole.ADMIN]:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only teachers and admins can review submissions"
+        )
     
-    # If student, filter to their team only
-    if current_user.role == UserRole.STUDENT:
-        membership = db.query(TeamMember).filter(
-            TeamMember.user_id == current_user.id
-        ).first()
-        
-        if membership:
-            query = query.filter(MissionSubmission.team_id == membership.team_id)
-        else:
-            return []  # No team, no submissions
+    now = datetime.utcnow()
+    submissions = db.query(MissionSubmission).filter(
+        MissionSubmission.status == MissionStatus.PENDING,
+        or_(
+            MissionSubmission.claimed_by.is_(None),
+            MissionSubmission.claimed_by == current_user.id,
+            MissionSubmission.claim_expires_at < now
+        )
+    ).order_by(
+        MissionSubmission.submitted_at, MissionSubmission.id
+    ).limit(n).with_for_update(skip_locked=True).all()
     
-    # Apply filters
-    if mission_id is not None:
-        query = query.filter(MissionSubmission.mission_id == mission_id)
+    lease_expires_at = now + timedelta(minutes=settings.SUBMISSION_CLAIM_LEASE_MINUTES)
+    for submission in submissions:
+        submission.claimed_by = current_user.id
+        submission.claim_expires_at = lease_expires_at
     
-    if team_id is not None:
-        query = query.filter(MissionSubmission.team_id == team_id)
+    db.commit()
+    return submissions
+
+
+@router.post("/submissions/{submission_id}/release", response_model=SubmissionResponse)
+async def release_submission(
+    submission_id: int,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Give a claimed submission back to the review queue.
     
-    if status is not None:
-        query = query.filter(MissionSubmission.status == status)
+    Only the reviewer holding the claim (or an admin) can release it.
+    """
+    submission = db.query(MissionSubmission).filter(
+        MissionSubmission.id == submission_id
+    ).with_for_update().first()
     
-    submissions = query.order_by(
-        MissionSubmission.submitted_at.desc()
-    ).offset(skip).limit(limit).all()
+    if not submission:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Submission not found"
+        )
     
-    return submissions
+    if submission.claimed_by != current_user.id and current_user.role != UserRole.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Submission is not claimed by you"
+        )
+    
+    submission.claimed_by = None
+    submission.claim_expires_at = None
+    db.commit()
+    db.refresh(submission)
+    
+    return submission
+
+
+@router.post("/submissions/review-batch", response_model=SubmissionBatchReviewResult)
+async def review_submissions_batch(
+    batch: SubmissionBatchReview,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Review many mission submissions in one transaction.
+    
+    Only teachers and admins can review submissions. Missions are loaded
+    once, points are applied with one update per team, badges are evaluated
+    once per approved submitter and notifications are written in one batch.
+    Items that are missing or no longer pending are skipped and reported.
+    
+    - **reviews**: List of {submission_id, status, review_comment} (max 100)
+    """
+    # Check if user is teacher or admin
+    if current_user.role not in [UserRole.TEACHER, UserRole.ADMIN]:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only teachers and admins can review submissions"
+        )
+    
+    # Validate statuses and IDs before touching anything
+    if any(item.status not in [MissionStatus.APPROVED, MissionStatus.REJECTED] for item in batch.reviews):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Status must be APPROVED or REJECTED"
+        )
+    
+    submission_ids = [item.submission_id for item in batch.reviews]
+    if len(set(submission_ids)) != len(submission_ids):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Duplicate submission IDs in batch"
+        )
+    
+    # Lock all rows up front, in ID order so overlapping batches cannot deadlock
+    submissions = {
+        submission.id: submission
+        for submission in db.query(MissionSubmission).filter(
+            MissionSubmission.id.in_(submission_ids)
+        ).order_by(MissionSubmission.id).with_for_update().all()
+    }
+    missions = {
+        mission.id: mission
+        for mission in db.query(Mission).filter(
+            Mission.id.in_({submission.mission_id for submission in submissions.values()})
+        ).all()
+    }
+    
+    # Import services
+    from app.services.badge_service import BadgeService
+    from app.services.notification_service import NotificationService
+    from app.services.points_service import PointsService
+    from app.services.mission_service import MissionService
+    
+    notification_service = NotificationService(db)
+    badge_service = BadgeService(db)
+    points_service = PointsService(db)
+    mission_service = MissionService(db)
+    notification_service.start_batch()
+    
+    reviewed = []
+    skipped = []
+    awards = []
+    approved_submitters = set()
+    reviewed_at = datetime.utcnow()
+    
+    for item in batch.reviews:
+        submission = submissions.get(item.submission_id)
+        if not submission:
+            skipped.append(SubmissionBatchSkip(submission_id=item.submission_id, reason="Submission not found"))
+            continue
+        if submission.status != MissionStatus.PENDING:
+            skipped.append(SubmissionBatchSkip(
+                submission_id=item.submission_id,
+                reason=f"Submission already {submission.status.value.lower()}"
+            ))
+            continue
+        if _claimed_by_other(submission, current_user.id, reviewed_at):
+            skipped.append(SubmissionBatchSkip(
+                submission_id=item.submission_id,
+                reason="Submission is claimed by another reviewer"
+            ))
+            continue
+        
+        mission = missions.get(submission.mission_id)
+        submission.status = item.status
+        submission.review_comment = item.review_comment
+        submission.reviewed_by = current_user.id
+        submission.reviewed_at = reviewed_at
+        submission.claimed_by = None
+        submission.claim_expires_at = None
+        reviewed.append(submission)
+        
+        if item.status == MissionStatus.APPROVED:
+            approved_submitters.add(submission.submitted_by)
+            if mission:
+                awards.append((submission, mission))
+                notification_service.notify_mission_approved(
+                    user_id=submission.submitted_by,
+                    mission_title=mission.title,
+                    points=mission.points,
+                    mission_id=mission.id
+                )
+        elif mission:
+            notification_service.notify_mission_rejected(
+                user_id=submission.submitted_by,
+                mission_title=mission.title,
+                feedback=item.review_comment or "No feedback provided",
+                mission_id=mission.id
+            )
+    
+    # One ledger insert, one totals update per team and per user
+    points_service.award_submissions(awards, awarded_by=current_user.id)
+    
+    # One counter update per mission
+    approved_per_mission = {}
+    for _, mission in awards:
+        approved_per_mission[mission.id] = approved_per_mission.get(mission.id, 0) + 1
+    for mission_id in sorted(approved_per_mission):
+        mission_service.adjust_counters(mission_id, approved=approved_per_mission[mission_id])
+    
+    # One badge evaluation per approved submitter
+    for user_id in sorted(approved_submitters):
+        newly_awarded = await badge_service.check_and_award_badges(user_id, commit=False)
+        for badge in newly_awarded:
+            notification_service.notify_badge_earned(
+                user_id=user_id,
+                badge_name=badge.name,
+                badge_id=badge.id
+            )
+    
+    notifications = notification_service.flush_batch()
+    db.commit()
+    notification_service.publish_notifications(notifications)
+    
+    # Reload the reviewed rows in one query for the response
+    if reviewed:
+        db.query(MissionSubmission).filter(
+            MissionSubmission.id.in_([submission.id for submission in reviewed])
+        ).all()
+    
+    return SubmissionBatchReviewResult(reviewed=reviewed, skipped=skipped)
 
 
 @router.post("/submissions/{submission_id}/review", response_model=SubmissionResponse)
@@ -516,10 +1024,10 @@ async def review_submission(
             detail="Only teachers and admins can review submissions"
         )
     
-    # Get submission
+    # Get submission, locking the row so concurrent reviewers serialize on it
     submission = db.query(MissionSubmission).filter(
         MissionSubmission.id == submission_id
-    ).first()
+    ).with_for_update().first()
     
     if not submission:
         raise HTTPException(
@@ -527,7 +1035,7 @@ async def review_submission(
             detail="Submission not found"
         )
     
-    # Check if already reviewed
+    # Check if already reviewed (re-read under the lock, so a second reviewer sees the first decision)
     if submission.status != MissionStatus.PENDING:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -541,6 +1049,13 @@ async def review_submission(
             detail="Status must be APPROVED or REJECTED"
         )
     
+    # Respect another reviewer's active claim from the review queue
+    if _claimed_by_other(submission, current_user.id, datetime.utcnow()):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Submission is claimed by another reviewer"
+        )
+    
     # Get mission and submitter
     mission = db.query(Mission).filter(Mission.id == submission.mission_id).first()
     submitter = db.query(User).filter(User.id == submission.submitted_by).first()
@@ -550,21 +1065,25 @@ async def review_submission(
     submission.review_comment = review_data.review_comment
     submission.reviewed_by = current_user.id
     submission.reviewed_at = datetime.utcnow()
+    submission.claimed_by = None
+    submission.claim_expires_at = None
     
     # Import services
     from app.services.badge_service import BadgeService
     from app.services.notification_service import NotificationService
+    from app.services.points_service import PointsService
+    from app.services.mission_service import MissionService
     
     notification_service = NotificationService(db)
     badge_service = BadgeService(db)
+    points_service = PointsService(db)
+    mission_service = MissionService(db)
     
-    # If approved, update team points and missions count
+    # If approved, record the award (atomically increments team and user totals)
     if review_data.status == MissionStatus.APPROVED:
-        team = db.query(Team).filter(Team.id == submission.team_id).first()
-        
-        if mission and team:
-            team.total_points += mission.points
-            team.missions_completed += 1
+        if mission:
+            points_service.award_submission(submission, mission, awarded_by=current_user.id)
+            mission_service.adjust_counters(mission.id, approved=1)
         
         # Send approval notification
         if submitter and mission:
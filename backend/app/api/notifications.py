@@ -3,35 +3,46 @@ Notification API
 Endpoints for user notifications
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
-from typing import List
+from sqlalchemy import desc, tuple_
+from typing import List, Optional
+from datetime import datetime
 
 from app.core.database import get_db
 from app.core.dependencies import get_current_user
 from app.models.user import User
 from app.models.notification import Notification
-from app.schemas.notification import NotificationResponse, NotificationUpdate
+from app.schemas.notification import NotificationResponse, NotificationUpdate, NotificationPreferences
 from app.services.notification_service import NotificationService, get_notification_service
+from app.services.event_bus import notification_bus
+from app.utils.pagination import decode_cursor, next_cursor, NEXT_CURSOR_HEADER
 
 router = APIRouter(tags=["Notifications"])
 
 
 @router.get("", response_model=List[NotificationResponse])
 async def get_notifications(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
     unread_only: bool = Query(False),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from the X-Next-Cursor header"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
-    Get notifications for the current user.
+    Get notifications for the current user, newest first.
     
-    - **skip**: Pagination offset
+    - **skip**: Pagination offset (ignored when a cursor is given)
     - **limit**: Number of notifications per page
     - **unread_only**: Filter to show only unread notifications
+    - **cursor**: Resume after the last notification of the previous page
+    
+    When a full page is returned, the `X-Next-Cursor` response header holds the
+    cursor for the next page. Cursor pages seek on (created_at, id), so deep
+    pages cost the same as the first one.
     """
     query = db.query(Notification).filter(
         Notification.user_id == current_user.id
@@ -40,9 +51,23 @@ async def get_notifications(
     if unread_only:
         query = query.filter(Notification.is_read == False)
     
-    notifications = query.order_by(
-        desc(Notification.created_at)
-    ).offset(skip).limit(limit).all()
+    if cursor:
+        created_at, notification_id = decode_cursor(cursor, (datetime, int))
+        query = query.filter(
+            tuple_(Notification.created_at, Notification.id) < (created_at, notification_id)
+        )
+    
+    query = query.order_by(
+        desc(Notification.created_at),
+        desc(Notification.id)
+    )
+    if not cursor:
+        query = query.offset(skip)
+    notifications = query.limit(limit).all()
+    
+    next_page = next_cursor(notifications, limit, "created_at", "id")
+    if next_page:
+        response.headers[NEXT_CURSOR_HEADER] = next_page
     
     return notifications
 
@@ -58,6 +83,72 @@ async def get_unread_count(
     return {"unread_count": count}
 
 
+@router.get("/stream")
+async def stream_notifications(
+    current_user: User = Depends(get_current_user),
+    notification_service: NotificationService = Depends(get_notification_service)
+):
+    """
+    Server-Sent Events stream of the current user's new notifications.
+    
+    Sends an `unread_count` event on connect, then a `notification` event
+    for every notification created for the user. Replaces polling of
+    `/notifications` and `/notifications/unread/count`.
+    
+    The stream requires the Authorization header, so connect with a
+    fetch-based EventSource client:
+    ```javascript
+    const source = new EventSourcePolyfill('/api/notifications/stream', {
+        headers: { Authorization: `Bearer ${token}` }
+    });
+    source.addEventListener('notification', (event) => {
+        const notification = JSON.parse(event.data);
+    });
+    ```
+    """
+    # Resolve the initial count before streaming so the DB session is not held open
+    unread_count = notification_service.get_unread_count(current_user.id)
+    
+    return StreamingResponse(
+        notification_bus.stream(
+            current_user.id,
+            initial_events=[("unread_count", {"unread_count": unread_count})]
+        ),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no"  # Disable nginx buffering
+        }
+    )
+
+
+@router.get("/preferences", response_model=NotificationPreferences)
+async def get_notification_preferences(
+    current_user: User = Depends(get_current_user)
+):
+    """Get the current user's notification delivery preferences"""
+    return NotificationPreferences(digest=current_user.notification_digest)
+
+
+@router.put("/preferences", response_model=NotificationPreferences)
+async def update_notification_preferences(
+    preferences: NotificationPreferences,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Update notification delivery preferences.
+    
+    - **digest**: Merge each day's mission approvals and badges into one
+      entry per type instead of a short rolling window
+    """
+    current_user.notification_digest = preferences.digest
+    db.commit()
+    
+    return NotificationPreferences(digest=current_user.notification_digest)
+
+
 @router.put("/{notification_id}/read")
 async def mark_notification_read(
     notification_id: int,
@@ -92,21 +183,16 @@ async def mark_all_notifications_read(
 async def delete_notification(
     notification_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    notification_service: NotificationService = Depends(get_notification_service)
 ):
     """Delete a notification"""
-    notification = db.query(Notification).filter(
-        Notification.id == notification_id,
-        Notification.user_id == current_user.id
-    ).first()
+    success = notification_service.delete_notification(notification_id, current_user.id)
     
-    if not notification:
+    if not success:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Notification not found"
         )
     
-    db.delete(notification)
-    db.commit()
-    
     return {"message": "Notification deleted"}
@@ -12,7 +12,8 @@ from app.core.database import get_db
 from app.core.dependencies import get_current_user, require_teacher_or_admin
 from app.models.user import User, UserRole
 from app.models.resource import Resource, ResourceType
-from app.models.category import Category
+from app.services.reference_cache import reference_cache
+from app.services.counter_buffer import counter_buffer
 from app.schemas.resource import (
     ResourceCreate, ResourceUpdate, ResourceResponse, ResourceSummary
 )
@@ -73,9 +74,7 @@ async def create_resource(
     """
     # Verify category exists if provided
     if resource_data.category_id:
-        category = db.query(Category).filter(
-            Category.id == resource_data.category_id
-        ).first()
+        category = reference_cache.get_category(db, resource_data.category_id)
         if not category:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -125,12 +124,12 @@ async def get_resource(
             detail="Resource not found"
         )
     
-    # Increment view count
-    resource.views += 1
-    db.commit()
-    db.refresh(resource)
+    # Increment view count (buffered; written by the counter flush job)
+    counter_buffer.increment(Resource, "views", resource.id)
     
-    return resource
+    response = ResourceResponse.model_validate(resource)
+    response.views = (resource.views or 0) + counter_buffer.pending(Resource, "views", resource.id)
+    return response
 
 
 @router.put("/{resource_id}", response_model=ResourceResponse)
@@ -237,11 +236,11 @@ async def track_download(
             detail="Resource not found"
         )
     
-    # Increment download count
-    resource.downloads += 1
-    db.commit()
+    # Increment download count (buffered; written by the counter flush job)
+    counter_buffer.increment(Resource, "downloads", resource.id)
+    downloads = (resource.downloads or 0) + counter_buffer.pending(Resource, "downloads", resource.id)
     
-    return {"message": "Download tracked", "downloads": resource.downloads}
+    return {"message": "Download tracked", "downloads": downloads}
 
 
 @router.get("/stats/summary")
@@ -76,12 +76,8 @@ async def get_global_stats(db: Session = Depends(get_db)):
         MissionSubmission.status == "approved"
     ).scalar() or 0
     
-    # Total points awarded
-    total_points = db.query(func.sum(Mission.points)).join(
-        MissionSubmission
-    ).filter(
-        MissionSubmission.status == "approved"
-    ).scalar() or 0
+    # Total points awarded (running team totals from the points ledger)
+    total_points = db.query(func.sum(Team.total_points)).scalar() or 0
     
     # Active users in last 30 days
     thirty_days_ago = datetime.utcnow() - timedelta(days=30)
@@ -98,19 +94,13 @@ async def get_global_stats(db: Session = Depends(get_db)):
         Team.id,
         Team.name,
         School.name.label("school_name"),
-        func.sum(Mission.points).label("total_points")
-    ).join(
-        MissionSubmission, Team.id == MissionSubmission.team_id
-    ).join(
-        Mission, MissionSubmission.mission_id == Mission.id
+        Team.total_points
     ).outerjoin(
         School, Team.school_id == School.id
     ).filter(
-        MissionSubmission.status == "approved"
-    ).group_by(
-        Team.id, Team.name, School.name
+        Team.total_points > 0
     ).order_by(
-        desc("total_points")
+        desc(Team.total_points), Team.id
     ).limit(5).all()
     
     top_teams = [
@@ -337,6 +337,10 @@ async def delete_team(
                 detail="Only team captain or admin can delete team"
             )
     
+    # Keep mission counters in step with the cascaded submissions
+    from app.services.mission_service import MissionService
+    MissionService(db).submissions_removed_for_team(team_id)
+    
     db.delete(team)
     db.commit()
 
@@ -63,6 +63,46 @@ class Settings(BaseSettings):
     SMTP_USER: Optional[str] = Field(default=None, env="SMTP_USER")
     SMTP_PASSWORD: Optional[str] = Field(default=None, env="SMTP_PASSWORD")
     
+    # Background Jobs
+    ENABLE_BACKGROUND_JOBS: bool = Field(default=True, env="ENABLE_BACKGROUND_JOBS")
+    
+    # Notification Coalescing
+    NOTIFICATION_COALESCE_WINDOW_MINUTES: int = Field(default=15, env="NOTIFICATION_COALESCE_WINDOW_MINUTES")
+    
+    # Notification Retention
+    NOTIFICATION_RETENTION_DAYS: int = Field(default=90, env="NOTIFICATION_RETENTION_DAYS")
+    NOTIFICATION_ARCHIVE_ENABLED: bool = Field(default=True, env="NOTIFICATION_ARCHIVE_ENABLED")
+    NOTIFICATION_PRUNE_BATCH_SIZE: int = Field(default=1000, env="NOTIFICATION_PRUNE_BATCH_SIZE")
+    NOTIFICATION_PRUNE_PAUSE_SECONDS: float = Field(default=0.2, env="NOTIFICATION_PRUNE_PAUSE_SECONDS")
+    NOTIFICATION_PRUNE_INTERVAL_SECONDS: int = Field(default=3600, env="NOTIFICATION_PRUNE_INTERVAL_SECONDS")
+    
+    # Points Ledger
+    POINTS_CHECKPOINT_INTERVAL_SECONDS: int = Field(default=3600, env="POINTS_CHECKPOINT_INTERVAL_SECONDS")
+    POINTS_CHECKPOINT_SETTLE_SECONDS: int = Field(default=60, env="POINTS_CHECKPOINT_SETTLE_SECONDS")
+    
+    # Review Queue
+    SUBMISSION_CLAIM_LEASE_MINUTES: int = Field(default=15, env="SUBMISSION_CLAIM_LEASE_MINUTES")
+    
+    # Reference Data Cache (missions and categories)
+    REFERENCE_CACHE_CHECK_SECONDS: int = Field(default=5, env="REFERENCE_CACHE_CHECK_SECONDS")
+    REFERENCE_CACHE_MAX_AGE_SECONDS: int = Field(default=300, env="REFERENCE_CACHE_MAX_AGE_SECONDS")
+    
+    # Mission Counters
+    MISSION_COUNTER_RECONCILE_INTERVAL_SECONDS: int = Field(default=86400, env="MISSION_COUNTER_RECONCILE_INTERVAL_SECONDS")
+    
+    # Mission Import
+    MISSION_IMPORT_BATCH_SIZE: int = Field(default=500, env="MISSION_IMPORT_BATCH_SIZE")
+    
+    # Mission Recommendations
+    RECOMMENDATIONS_INTERVAL_SECONDS: int = Field(default=3600, env="RECOMMENDATIONS_INTERVAL_SECONDS")
+    RECOMMENDATIONS_PER_TEAM: int = Field(default=10, env="RECOMMENDATIONS_PER_TEAM")
+    
+    # Write-behind view/download counters
+    COUNTER_FLUSH_INTERVAL_SECONDS: int = Field(default=5, env="COUNTER_FLUSH_INTERVAL_SECONDS")
+    
+    # Forum
+    FORUM_THREAD_MAX_DEPTH: int = Field(default=50, env="FORUM_THREAD_MAX_DEPTH")
+    
     # Feature Flags
     ENABLE_REGISTRATION: bool = Field(default=True, env="ENABLE_REGISTRATION")
     ENABLE_EMAIL_VERIFICATION: bool = Field(default=False, env="ENABLE_EMAIL_VERIFICATION")
@@ -11,8 +11,12 @@ from app.models.mission import Mission, MissionSubmission, MissionDifficulty, Mi
 from app.models.badge import Badge, UserBadge
 from app.models.resource import Resource, ResourceType
 from app.models.forum import ForumPost, Comment
-from app.models.notification import Notification, NotificationType
+from app.models.notification import Notification, NotificationArchive, NotificationType
 from app.models.leaderboard import LeaderboardSnapshot
+from app.models.points import PointsLedgerEntry, PointsCheckpoint, PointsEntryType
+from app.models.season import Season, SeasonStanding
+from app.models.reference import ReferenceDataVersion
+from app.models.recommendation import TeamRecommendation
 
 __all__ = [
     "User",
@@ -32,6 +36,14 @@ __all__ = [
     "ForumPost",
     "Comment",
     "Notification",
+    "NotificationArchive",
     "NotificationType",
     "LeaderboardSnapshot",
+    "PointsLedgerEntry",
+    "PointsCheckpoint",
+    "PointsEntryType",
+    "Season",
+    "SeasonStanding",
+    "ReferenceDataVersion",
+    "TeamRecommendation",
 ]
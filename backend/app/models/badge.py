@@ -15,7 +15,9 @@ class Badge(Base):
     
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(100), unique=True, nullable=False, index=True)
+    slug = Column(String(100), unique=True, index=True)
     description = Column(Text)
+    icon = Column(String(100))  # Emoji or icon name
     icon_url = Column(String(500))
     
     # Criteria (stored as JSON or specific fields)
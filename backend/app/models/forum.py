@@ -3,7 +3,7 @@ Forum and Comment Models
 Community discussion features
 """
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Boolean, Index, DDL, event, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -12,6 +12,15 @@ from app.core.database import Base
 
 class ForumPost(Base):
     __tablename__ = "forum_posts"
+    __table_args__ = (
+        # Keyset pagination in listing order (pinned first, newest first),
+        # globally and per category
+        Index("ix_forum_posts_pinned_created_id", text("is_pinned DESC"), text("created_at DESC"), text("id DESC")),
+        Index(
+            "ix_forum_posts_category_pinned_created_id",
+            "category_id", text("is_pinned DESC"), text("created_at DESC"), text("id DESC")
+        ),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(255), nullable=False, index=True)
@@ -27,12 +36,14 @@ class ForumPost(Base):
     is_pinned = Column(Boolean, default=False)
     is_locked = Column(Boolean, default=False)
     
-    # Stats
+    # Stats (comments_count is maintained on comment create/delete)
     views = Column(Integer, default=0)
+    comments_count = Column(Integer, default=0, server_default="0", nullable=False)
     
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    last_activity_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     
     # Relationships
     author = relationship("User", back_populates="forum_posts")
@@ -43,8 +54,37 @@ class ForumPost(Base):
         return f"<ForumPost {self.title}>"
 
 
+# Full-text search (PostgreSQL only): a generated tsvector over French and
+# English stems of the title (weight A) and content (weight B), with a GIN
+# index. It is not mapped on the model; queries reference it by name.
+FORUM_POST_SEARCH_VECTOR = (
+    "setweight(to_tsvector('french', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('french', coalesce(content, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(content, '')), 'B')"
+)
+
+event.listen(
+    ForumPost.__table__, "after_create",
+    DDL(
+        f"ALTER TABLE forum_posts ADD COLUMN search_vector tsvector "
+        f"GENERATED ALWAYS AS ({FORUM_POST_SEARCH_VECTOR}) STORED"
+    ).execute_if(dialect="postgresql")
+)
+event.listen(
+    ForumPost.__table__, "after_create",
+    DDL(
+        "CREATE INDEX ix_forum_posts_search_vector ON forum_posts USING gin (search_vector)"
+    ).execute_if(dialect="postgresql")
+)
+
+
 class Comment(Base):
     __tablename__ = "comments"
+    __table_args__ = (
+        # Whole-thread scans in display order
+        Index("ix_comments_forum_post_id_created_at", "forum_post_id", "created_at"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     content = Column(Text, nullable=False)
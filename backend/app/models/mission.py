@@ -3,7 +3,7 @@ Mission and MissionSubmission Models
 Handles NIRD missions and team submissions
 """
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Enum, Boolean
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Enum, Boolean, Index, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
@@ -50,6 +50,10 @@ class Mission(Base):
     # Status
     is_active = Column(Boolean, default=True)
     
+    # Statistics (denormalized, maintained by MissionService)
+    submission_count = Column(Integer, default=0, server_default="0", nullable=False)
+    approved_count = Column(Integer, default=0, server_default="0", nullable=False)
+    
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -64,6 +68,20 @@ class Mission(Base):
 
 class MissionSubmission(Base):
     __tablename__ = "mission_submissions"
+    __table_args__ = (
+        # Review work queue: oldest pending submissions first
+        Index(
+            "ix_mission_submissions_pending_queue", "submitted_at", "id",
+            postgresql_where=text("status = 'PENDING'")
+        ),
+        # At most one pending or approved submission per team and mission
+        Index(
+            "uq_mission_submissions_active_team_mission", "mission_id", "team_id",
+            unique=True,
+            postgresql_where=text("status IN ('PENDING', 'APPROVED')"),
+            sqlite_where=text("status IN ('PENDING', 'APPROVED')")
+        ),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     mission_id = Column(Integer, ForeignKey("missions.id"), nullable=False)
@@ -80,6 +98,10 @@ class MissionSubmission(Base):
     reviewed_by = Column(Integer, ForeignKey("users.id"), nullable=True)
     review_comment = Column(Text)
     
+    # Review queue claim (lease held by one reviewer until it expires)
+    claimed_by = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    claim_expires_at = Column(DateTime(timezone=True), nullable=True)
+    
     # Timestamps
     submitted_at = Column(DateTime(timezone=True), server_default=func.now())
     reviewed_at = Column(DateTime(timezone=True))
@@ -89,6 +111,7 @@ class MissionSubmission(Base):
     team = relationship("Team", back_populates="mission_submissions")
     submitted_by_user = relationship("User", foreign_keys=[submitted_by], back_populates="mission_submissions")
     reviewed_by_user = relationship("User", foreign_keys=[reviewed_by])
+    claimed_by_user = relationship("User", foreign_keys=[claimed_by])
     
     def __repr__(self):
         return f"<MissionSubmission mission_id={self.mission_id} team_id={self.team_id} status={self.status}>"
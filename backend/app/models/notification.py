@@ -3,9 +3,9 @@ Notification Model
 User notifications system
 """
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Boolean, Enum
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Boolean, Enum, Index
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 import enum
 
 from app.core.database import Base
@@ -25,6 +25,20 @@ class NotificationType(str, enum.Enum):
 
 class Notification(Base):
     __tablename__ = "notifications"
+    __table_args__ = (
+        Index("ix_notifications_user_id_is_read", "user_id", "is_read"),
+        # Inbox keyset pagination, with a smaller partial index for unread_only
+        Index("ix_notifications_user_created_id", "user_id", text("created_at DESC"), text("id DESC")),
+        Index(
+            "ix_notifications_unread_user_created_id", "user_id", text("created_at DESC"), text("id DESC"),
+            postgresql_where=text("is_read = false")
+        ),
+        # Supports the retention job's scan for old read notifications
+        Index(
+            "ix_notifications_read_created_at", "created_at",
+            postgresql_where=text("is_read = true")
+        ),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -35,11 +49,16 @@ class Notification(Base):
     message = Column(Text)
     
     # Link/action
+    related_id = Column(Integer)
+    related_type = Column(String(50))
     action_url = Column(String(500))
     
     # Status
     is_read = Column(Boolean, default=False, index=True)
     
+    # Number of events merged into this notification by coalescing
+    group_count = Column(Integer, default=1, server_default="1", nullable=False)
+    
     # Timestamp
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     read_at = Column(DateTime(timezone=True))
@@ -49,3 +68,29 @@ class Notification(Base):
     
     def __repr__(self):
         return f"<Notification {self.type} for user_id={self.user_id}>"
+
+
+class NotificationArchive(Base):
+    """Cold storage for notifications pruned from the hot table by the retention job"""
+    __tablename__ = "notifications_archive"
+    __table_args__ = (
+        Index("ix_notifications_archive_user_id_created_at", "user_id", "created_at"),
+    )
+    
+    id = Column(Integer, primary_key=True)  # Same ID as the original notification
+    user_id = Column(Integer, nullable=False)
+    
+    type = Column(Enum(NotificationType), nullable=False)
+    title = Column(String(255), nullable=False)
+    message = Column(Text)
+    related_id = Column(Integer)
+    related_type = Column(String(50))
+    action_url = Column(String(500))
+    is_read = Column(Boolean, default=True)
+    
+    created_at = Column(DateTime(timezone=True))
+    read_at = Column(DateTime(timezone=True))
+    archived_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    def __repr__(self):
+        return f"<NotificationArchive {self.type} for user_id={self.user_id}>"
@@ -0,0 +1,80 @@
+"""
+Points Ledger Models
+Append-only record of every point movement, with periodic checkpoints
+"""
+
+from sqlalchemy import Column, Integer, Text, DateTime, ForeignKey, Enum, Index
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+import enum
+
+from app.core.database import Base
+
+
+class PointsEntryType(str, enum.Enum):
+    """Kinds of ledger entries"""
+    AWARD = "award"            # Approved mission submission
+    REVERSAL = "reversal"      # Cancels an earlier award
+    ADJUSTMENT = "adjustment"  # Manual correction by an admin
+
+
+class PointsLedgerEntry(Base):
+    __tablename__ = "points_ledger"
+    __table_args__ = (
+        Index("ix_points_ledger_team_id_id", "team_id", "id"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    team_id = Column(Integer, ForeignKey("teams.id", ondelete="CASCADE"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True, index=True)
+    
+    # Source of the entry
+    entry_type = Column(Enum(PointsEntryType), nullable=False)
+    submission_id = Column(Integer, ForeignKey("mission_submissions.id", ondelete="SET NULL"), nullable=True, index=True)
+    mission_id = Column(Integer, ForeignKey("missions.id", ondelete="SET NULL"), nullable=True)
+    reason = Column(Text)
+    created_by = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    
+    # Signed deltas
+    points = Column(Integer, nullable=False)
+    missions_delta = Column(Integer, default=0, nullable=False)
+    
+    # Timestamp
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+    
+    # Relationships
+    team = relationship("Team", back_populates="points_ledger")
+    
+    def __repr__(self):
+        return f"<PointsLedgerEntry {self.entry_type} {self.points:+d} team_id={self.team_id}>"
+
+
+class PointsCheckpoint(Base):
+    """
+    Team running totals folded up to (and including) ledger entry `ledger_id`.
+    
+    A team only gets a new row when it has ledger activity since its previous
+    checkpoint, so its state at any checkpoint is its latest row at or below it.
+    Every folded entry was created at or before `settled_at`, and every later
+    entry after it, which lets point-in-time reads start from a checkpoint.
+    """
+    __tablename__ = "points_checkpoints"
+    __table_args__ = (
+        Index("ix_points_checkpoints_team_id_ledger_id", "team_id", "ledger_id"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    ledger_id = Column(Integer, nullable=False, index=True)
+    team_id = Column(Integer, ForeignKey("teams.id", ondelete="CASCADE"), nullable=False)
+    
+    total_points = Column(Integer, nullable=False)
+    missions_completed = Column(Integer, nullable=False)
+    
+    settled_at = Column(DateTime(timezone=True), nullable=False, index=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+    
+    # Relationships
+    team = relationship("Team", back_populates="points_checkpoints")
+    
+    def __repr__(self):
+        return f"<PointsCheckpoint team_id={self.team_id} at ledger_id={self.ledger_id}>"
@@ -0,0 +1,37 @@
+"""
+Recommendation Models
+Precomputed "next missions" suggestions per team
+"""
+
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Index
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+
+
+class TeamRecommendation(Base):
+    """
+    One suggested mission for a team, ranked within the team.
+    
+    Rows are rebuilt in bulk by the recommendation job; reads are a single
+    lookup on (team_id, rank).
+    """
+    __tablename__ = "team_recommendations"
+    __table_args__ = (
+        Index("ix_team_recommendations_team_id_rank", "team_id", "rank", unique=True),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    team_id = Column(Integer, ForeignKey("teams.id", ondelete="CASCADE"), nullable=False)
+    mission_id = Column(Integer, ForeignKey("missions.id", ondelete="CASCADE"), nullable=False, index=True)
+    
+    # Ranking
+    rank = Column(Integer, nullable=False)
+    score = Column(Float, nullable=False)
+    reason = Column(String(30), nullable=False)  # category, difficulty, similar_teams or popular
+    
+    # Timestamp
+    computed_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    def __repr__(self):
+        return f"<TeamRecommendation team={self.team_id} #{self.rank} mission={self.mission_id}>"
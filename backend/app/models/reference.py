@@ -0,0 +1,22 @@
+"""
+Reference Data Version Model
+Shared version counters used to invalidate per-process reference data caches
+"""
+
+from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+
+
+class ReferenceDataVersion(Base):
+    __tablename__ = "reference_data_versions"
+    
+    name = Column(String(50), primary_key=True)
+    version = Column(Integer, default=0, nullable=False)
+    
+    # Timestamp
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    
+    def __repr__(self):
+        return f"<ReferenceDataVersion {self.name} v{self.version}>"
@@ -0,0 +1,68 @@
+"""
+Season Models
+Competition periods with their frozen final standings
+"""
+
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Boolean, Index
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+
+
+class Season(Base):
+    __tablename__ = "seasons"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String(255), nullable=False)
+    
+    # Period (ends_at is the planned end until the season is closed)
+    starts_at = Column(DateTime(timezone=True), nullable=False, index=True)
+    ends_at = Column(DateTime(timezone=True), nullable=True)
+    
+    # Status
+    is_active = Column(Boolean, default=True, index=True)
+    closed_at = Column(DateTime(timezone=True), nullable=True)
+    
+    # Timestamps
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    # Relationships
+    standings = relationship(
+        "SeasonStanding", back_populates="season",
+        cascade="all, delete-orphan", passive_deletes=True,
+        order_by="SeasonStanding.rank"
+    )
+    
+    def __repr__(self):
+        return f"<Season {self.name} active={self.is_active}>"
+
+
+class SeasonStanding(Base):
+    """
+    Final rank of a team in a closed season.
+    
+    Team name and ID are frozen here without a foreign key, so the archive
+    outlives renamed or deleted teams.
+    """
+    __tablename__ = "season_standings"
+    __table_args__ = (
+        Index("ix_season_standings_season_id_rank", "season_id", "rank"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    season_id = Column(Integer, ForeignKey("seasons.id", ondelete="CASCADE"), nullable=False)
+    team_id = Column(Integer, nullable=False, index=True)
+    
+    # Frozen standing
+    team_name = Column(String(255), nullable=False)
+    school_name = Column(String(255), nullable=True)
+    rank = Column(Integer, nullable=False)
+    total_points = Column(Integer, nullable=False)
+    missions_completed = Column(Integer, nullable=False)
+    
+    # Relationships
+    season = relationship("Season", back_populates="standings")
+    
+    def __repr__(self):
+        return f"<SeasonStanding season_id={self.season_id} rank={self.rank} team_id={self.team_id}>"
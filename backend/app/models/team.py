@@ -38,6 +38,8 @@ class Team(Base):
     members = relationship("TeamMember", back_populates="team", cascade="all, delete-orphan")
     mission_submissions = relationship("MissionSubmission", back_populates="team", cascade="all, delete-orphan")
     leaderboard_snapshots = relationship("LeaderboardSnapshot", back_populates="team", cascade="all, delete-orphan")
+    points_ledger = relationship("PointsLedgerEntry", back_populates="team", cascade="all, delete-orphan", passive_deletes=True)
+    points_checkpoints = relationship("PointsCheckpoint", back_populates="team", cascade="all, delete-orphan", passive_deletes=True)
     
     def __repr__(self):
         return f"<Team {self.name} - {self.total_points} pts>"
@@ -32,6 +32,13 @@ class User(Base):
     is_verified = Column(Boolean, default=False)
     avatar_url = Column(String(500))
     
+    # Notification preferences
+    notification_digest = Column(Boolean, default=False, server_default="false", nullable=False)
+    
+    # Denormalized counters
+    total_points = Column(Integer, default=0, server_default="0", nullable=False)  # Running total of the points ledger
+    unread_notifications = Column(Integer, default=0, server_default="0", nullable=False)
+    
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -60,13 +60,15 @@ from app.schemas.forum import (
 
 # Notification schemas
 from app.schemas.notification import (
-    NotificationCreate, NotificationResponse, NotificationMarkRead
+    NotificationCreate, NotificationResponse, NotificationMarkRead,
+    NotificationPreferences
 )
 
 # Leaderboard schemas
 from app.schemas.leaderboard import (
     LeaderboardEntry, LeaderboardResponse,
-    TeamRankHistory, RankSnapshot, LeaderboardStats
+    TeamRankHistory, RankSnapshot, LeaderboardStats,
+    SeasonCreate, SeasonResponse, SeasonLeaderboardResponse
 )
 
 # Statistics schemas
@@ -108,9 +110,11 @@ __all__ = [
     "CommentResponse", "CommentWithAuthor",
     # Notification
     "NotificationCreate", "NotificationResponse", "NotificationMarkRead",
+    "NotificationPreferences",
     # Leaderboard
     "LeaderboardEntry", "LeaderboardResponse",
     "TeamRankHistory", "RankSnapshot", "LeaderboardStats",
+    "SeasonCreate", "SeasonResponse", "SeasonLeaderboardResponse",
     # Stats
     "GlobalStats", "CategoryStats", "ImpactCalculator",
     "ImpactCalculatorInput", "RegionalStats", "TimeSeriesData", "ChartData",
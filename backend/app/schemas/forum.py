@@ -38,6 +38,7 @@ class ForumPostResponse(ForumPostBase):
     views: int
     created_at: datetime
     updated_at: Optional[datetime] = None
+    last_activity_at: Optional[datetime] = None
     
     model_config = ConfigDict(from_attributes=True)
 
@@ -46,6 +47,7 @@ class ForumPostWithAuthor(ForumPostResponse):
     """Forum post with author details"""
     author: UserSummary
     comments_count: int = 0
+    snippet: Optional[str] = None  # Highlighted match, only when searching
 
 
 class ForumPostSummary(BaseModel):
@@ -92,6 +94,7 @@ class CommentWithAuthor(CommentResponse):
     """Comment with author details"""
     author: UserSummary
     replies: List['CommentWithAuthor'] = []
+    replies_count: int = 0  # Direct replies, including any not returned
 
 
 # Allow forward references
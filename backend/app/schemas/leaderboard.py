@@ -3,7 +3,7 @@ Leaderboard Schemas
 Request/Response models for leaderboard endpoints
 """
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List
 from datetime import datetime
 
@@ -65,3 +65,31 @@ class LeaderboardStats(BaseModel):
     most_active_team: Optional[str] = None
     most_improved_team: Optional[str] = None
     last_updated: datetime
+
+
+class SeasonCreate(BaseModel):
+    """Schema for starting a season"""
+    name: str = Field(..., min_length=1, max_length=255)
+    starts_at: Optional[datetime] = None  # Defaults to now
+    ends_at: Optional[datetime] = None  # Planned end (closing still has to be triggered)
+
+
+class SeasonResponse(BaseModel):
+    """Season details"""
+    id: int
+    name: str
+    starts_at: datetime
+    ends_at: Optional[datetime] = None
+    is_active: bool
+    closed_at: Optional[datetime] = None
+    
+    model_config = ConfigDict(from_attributes=True)
+
+
+class SeasonLeaderboardResponse(BaseModel):
+    """Season standings (live for the active season, archived once closed)"""
+    season: SeasonResponse
+    entries: List[LeaderboardEntry]
+    total_teams: int
+    is_final: bool
+    last_updated: datetime
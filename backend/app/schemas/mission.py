@@ -4,9 +4,11 @@ Request/Response models for mission-related endpoints
 """
 
 from pydantic import BaseModel, Field, ConfigDict
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 from app.models.mission import MissionDifficulty, MissionStatus
+from app.schemas.user import UserSummary
+from app.schemas.team import TeamSummary
 
 
 class CategorySummary(BaseModel):
@@ -33,6 +35,29 @@ class MissionCreate(MissionBase):
     requires_description: bool = True
 
 
+class MissionImportRow(MissionCreate):
+    """One row of a bulk mission import (category by ID or by slug/name)"""
+    category_id: Optional[int] = None
+    category: Optional[str] = None
+    requirements: Optional[str] = None
+    instructions: Optional[str] = None
+    is_active: bool = True
+
+
+class MissionImportError(BaseModel):
+    """A row that could not be imported"""
+    row: int
+    error: str
+
+
+class MissionImportResult(BaseModel):
+    """Outcome of a bulk mission import"""
+    created: int = 0
+    updated: int = 0
+    skipped: int = 0
+    errors: List[MissionImportError] = []
+
+
 class MissionUpdate(BaseModel):
     """Schema for updating mission info"""
     title: Optional[str] = Field(None, min_length=1, max_length=255)
@@ -86,6 +111,17 @@ class MissionSummary(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class MissionCatalogItem(MissionSummary):
+    """Mission listing entry with the calling team's progress on it"""
+    team_status: str = "none"  # none, pending, approved or rejected
+
+
+class MissionRecommendation(MissionSummary):
+    """Suggested next mission for a team"""
+    score: float
+    reason: str  # category, difficulty, similar_teams or popular
+
+
 # Submission Schemas
 
 class SubmissionBase(BaseModel):
@@ -117,18 +153,49 @@ class SubmissionResponse(SubmissionBase):
     status: MissionStatus
     reviewed_by: Optional[int] = None
     review_comment: Optional[str] = None
+    claimed_by: Optional[int] = None
+    claim_expires_at: Optional[datetime] = None
     submitted_at: datetime
     reviewed_at: Optional[datetime] = None
     
     model_config = ConfigDict(from_attributes=True)
 
 
+class SubmissionExpanded(SubmissionResponse):
+    """Submission with related objects requested through include="""
+    mission: Optional[MissionSummary] = None
+    team: Optional[TeamSummary] = None
+    submitter: Optional[UserSummary] = None
+
+
 class SubmissionReview(BaseModel):
     """Schema for reviewing a submission"""
     status: MissionStatus = Field(..., description="Must be APPROVED or REJECTED")
     review_comment: Optional[str] = None
 
 
+class SubmissionBatchReviewItem(SubmissionReview):
+    """A single decision within a batch review"""
+    submission_id: int
+
+
+class SubmissionBatchReview(BaseModel):
+    """Schema for reviewing many submissions in one request"""
+    reviews: List[SubmissionBatchReviewItem] = Field(..., min_length=1, max_length=100)
+
+
+class SubmissionBatchSkip(BaseModel):
+    """A batch item that was not applied"""
+    submission_id: int
+    reason: str
+
+
+class SubmissionBatchReviewResult(BaseModel):
+    """Outcome of a batch review"""
+    reviewed: List[SubmissionResponse]
+    skipped: List[SubmissionBatchSkip] = []
+
+
 class SubmissionWithDetails(SubmissionResponse):
     """Submission with mission and team details"""
     mission: MissionSummary
@@ -25,8 +25,11 @@ class NotificationResponse(BaseModel):
     type: NotificationType
     title: str
     message: Optional[str] = None
+    related_id: Optional[int] = None
+    related_type: Optional[str] = None
     action_url: Optional[str] = None
     is_read: bool
+    group_count: int = 1
     created_at: datetime
     read_at: Optional[datetime] = None
     
@@ -41,3 +44,8 @@ class NotificationMarkRead(BaseModel):
 class NotificationUpdate(BaseModel):
     """Schema for updating notification"""
     is_read: Optional[bool] = None
+
+
+class NotificationPreferences(BaseModel):
+    """Schema for a user's notification delivery preferences"""
+    digest: bool = False
@@ -87,10 +87,13 @@ class BadgeService:
     def __init__(self, db: Session):
         self.db = db
     
-    async def check_and_award_badges(self, user_id: int) -> List[Badge]:
+    async def check_and_award_badges(self, user_id: int, commit: bool = True) -> List[Badge]:
         """
         Check all badge criteria for a user and award new badges.
         Returns list of newly awarded badges.
+        
+        With commit=False, changes are only flushed so the caller's
+        transaction stays open (e.g. batch reviews).
         """
         newly_awarded = []
         
@@ -117,8 +120,11 @@ class BadgeService:
                     icon=criteria["icon"]
                 )
                 self.db.add(badge)
-                self.db.commit()
-                self.db.refresh(badge)
+                if commit:
+                    self.db.commit()
+                    self.db.refresh(badge)
+                else:
+                    self.db.flush()
             
             # Skip if already awarded
             if badge.id in awarded_badge_ids:
@@ -136,7 +142,10 @@ class BadgeService:
                 newly_awarded.append(badge)
         
         if newly_awarded:
-            self.db.commit()
+            if commit:
+                self.db.commit()
+            else:
+                self.db.flush()
         
         return newly_awarded
     
@@ -168,21 +177,15 @@ class BadgeService:
     
     async def check_points(self, user: User, badge_slug: str) -> bool:
         """Check if user earned enough points"""
-        from app.models.mission import Mission
-        
         thresholds = {
             "points_100": 100,
             "points_500": 500
         }
         threshold = thresholds.get(badge_slug, 0)
         
-        total_points = self.db.query(func.sum(Mission.points)).join(
-            MissionSubmission
-        ).filter(
-            and_(
-                MissionSubmission.submitted_by == user.id,
-                MissionSubmission.status == "approved"
-            )
+        # Read the running total straight from the row (the ORM copy may be stale)
+        total_points = self.db.query(User.total_points).filter(
+            User.id == user.id
         ).scalar() or 0
         
         return total_points >= threshold
@@ -206,7 +209,6 @@ class BadgeService:
     async def check_team_rank(self, user: User, badge_slug: str) -> bool:
         """Check if user's team is in top 3"""
         from app.models.team import Team, TeamMember
-        from app.models.mission import Mission
         
         # Get user's team
         team_member = self.db.query(TeamMember).filter(
@@ -216,20 +218,11 @@ class BadgeService:
         if not team_member:
             return False
         
-        # Calculate team rankings
-        rankings = self.db.query(
-            Team.id,
-            func.sum(Mission.points).label("total_points")
-        ).join(
-            MissionSubmission, Team.id == MissionSubmission.team_id
-        ).join(
-            Mission, MissionSubmission.mission_id == Mission.id
-        ).filter(
-            MissionSubmission.status == "approved"
-        ).group_by(
-            Team.id
+        # Team rankings from the running totals
+        rankings = self.db.query(Team.id).filter(
+            Team.total_points > 0
         ).order_by(
-            func.sum(Mission.points).desc()
+            Team.total_points.desc(), Team.id
         ).limit(3).all()
         
         top_team_ids = [r.id for r in rankings]
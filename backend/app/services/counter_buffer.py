@@ -0,0 +1,110 @@
+"""
+Counter Buffer
+Write-behind buffer for hot view/download counters
+"""
+
+from sqlalchemy.orm import Session
+from sqlalchemy import Integer, bindparam, column, func, update, values
+from typing import Dict, Tuple, Type
+from collections import defaultdict
+import threading
+
+from app.core.database import Base, SessionLocal
+
+CounterKey = Tuple[Type[Base], str, int]
+
+
+class CounterBuffer:
+    """
+    Accumulates counter increments in memory and writes them in batches.
+
+    Readers bump a counter without opening a write transaction; a periodic
+    flush turns all pending increments for one column into a single UPDATE
+    (UPDATE ... FROM (VALUES ...) on PostgreSQL). Pending increments live in
+    this process only, so the application flushes once more on shutdown.
+    """
+
+    def __init__(self):
+        self._pending: Dict[CounterKey, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def increment(self, model: Type[Base], column_name: str, row_id: int, amount: int = 1) -> None:
+        """Add to a row's counter; written on the next flush"""
+        with self._lock:
+            self._pending[(model, column_name, row_id)] += amount
+
+    def pending(self, model: Type[Base], column_name: str, row_id: int) -> int:
+        """Increments not yet written for a row's counter"""
+        with self._lock:
+            return self._pending.get((model, column_name, row_id), 0)
+
+    def flush(self, db: Session) -> int:
+        """
+        Write all pending increments and commit.
+
+        On failure the increments are put back, so they are retried on the
+        next flush instead of being lost.
+
+        Returns:
+            Number of rows updated
+        """
+        with self._lock:
+            batch, self._pending = self._pending, defaultdict(int)
+        if not batch:
+            return 0
+
+        grouped: Dict[Tuple[Type[Base], str], Dict[int, int]] = defaultdict(dict)
+        for (model, column_name, row_id), amount in batch.items():
+            grouped[(model, column_name)][row_id] = amount
+
+        try:
+            for (model, column_name), deltas in grouped.items():
+                self._write(db, model, column_name, deltas)
+            db.commit()
+        except Exception:
+            db.rollback()
+            with self._lock:
+                for key, amount in batch.items():
+                    self._pending[key] += amount
+            raise
+
+        return len(batch)
+
+    def _write(self, db: Session, model: Type[Base], column_name: str, deltas: Dict[int, int]) -> None:
+        """Apply one column's increments in a single statement"""
+        table = model.__table__
+        counter = table.c[column_name]
+        # A view or download is not an edit: keep onupdate timestamps as they are
+        untouched = {table.c.updated_at: table.c.updated_at} if "updated_at" in table.c else {}
+
+        if db.get_bind().dialect.name == "postgresql":
+            rows = values(
+                column("id", Integer), column("amount", Integer), name="deltas"
+            ).data(list(deltas.items()))
+            db.execute(
+                update(table).where(table.c.id == rows.c.id).values(
+                    {counter: func.coalesce(counter, 0) + rows.c.amount, **untouched}
+                )
+            )
+            return
+
+        # Other databases: one executemany of per-row increments
+        db.execute(
+            update(table).where(table.c.id == bindparam("row_id")).values(
+                {counter: func.coalesce(counter, 0) + bindparam("amount"), **untouched}
+            ),
+            [{"row_id": row_id, "amount": amount} for row_id, amount in deltas.items()]
+        )
+
+
+# Process-wide buffer shared by all requests
+counter_buffer = CounterBuffer()
+
+
+def flush_counters_job() -> None:
+    """Background job: write buffered view and download counts"""
+    db = SessionLocal()
+    try:
+        counter_buffer.flush(db)
+    finally:
+        db.close()
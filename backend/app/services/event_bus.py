@@ -0,0 +1,127 @@
+"""
+Event Bus
+In-process publish/subscribe hub feeding Server-Sent Events streams
+"""
+
+import asyncio
+import json
+import threading
+from collections import defaultdict
+from typing import Any, AsyncGenerator, Dict, Hashable, Iterable, Optional, Set, Tuple
+
+from fastapi.encoders import jsonable_encoder
+
+
+def format_sse(event: str, data: Any) -> str:
+    """Format a payload as a Server-Sent Events message"""
+    return f"event: {event}\ndata: {json.dumps(jsonable_encoder(data))}\n\n"
+
+
+class Subscription:
+    """A single subscriber's mailbox, bound to the event loop that reads it"""
+
+    def __init__(self, channel: Hashable, max_queue_size: int):
+        self.channel = channel
+        self.loop = asyncio.get_running_loop()
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
+
+    def deliver(self, message: str) -> None:
+        """Enqueue a message, dropping the oldest one if the client is too slow"""
+        if self.queue.full():
+            self.queue.get_nowait()
+        self.queue.put_nowait(message)
+
+
+class EventBus:
+    """
+    Process-wide pub/sub keyed by channel (e.g. a user ID).
+
+    Publishers may run on the event loop or in a worker thread; messages are
+    handed to each subscriber's loop with call_soon_threadsafe. Delivery is
+    limited to the current process, so each worker serves its own clients.
+    """
+
+    def __init__(self, max_queue_size: int = 100):
+        self.max_queue_size = max_queue_size
+        self._subscribers: Dict[Hashable, Set[Subscription]] = defaultdict(set)
+        self._lock = threading.Lock()
+
+    def subscribe(self, channel: Hashable) -> Subscription:
+        """Register a new subscriber on a channel (must be called from a running loop)"""
+        subscription = Subscription(channel, self.max_queue_size)
+        with self._lock:
+            self._subscribers[channel].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Remove a subscriber from its channel"""
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.channel)
+            if subscribers is None:
+                return
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscribers[subscription.channel]
+
+    def has_subscribers(self, channel: Hashable) -> bool:
+        """Check whether anyone is listening on a channel"""
+        with self._lock:
+            return bool(self._subscribers.get(channel))
+
+    def publish(self, channel: Hashable, event: str, data: Any) -> int:
+        """
+        Publish an event to every subscriber of a channel.
+
+        Returns:
+            Number of subscribers the event was handed to
+        """
+        with self._lock:
+            subscribers = list(self._subscribers.get(channel, ()))
+        if not subscribers:
+            return 0
+
+        message = format_sse(event, data)
+        delivered = 0
+        for subscription in subscribers:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.deliver, message)
+                delivered += 1
+            except RuntimeError:
+                # Subscriber's loop is closed; it will never read again
+                self.unsubscribe(subscription)
+        return delivered
+
+    async def stream(
+        self,
+        channel: Hashable,
+        initial_events: Iterable[Tuple[str, Any]] = (),
+        heartbeat_seconds: Optional[float] = 15.0
+    ) -> AsyncGenerator[str, None]:
+        """
+        Subscribe to a channel and yield SSE messages until the client disconnects.
+
+        Args:
+            channel: Channel to listen on
+            initial_events: (event, data) pairs sent immediately after connecting
+            heartbeat_seconds: Interval for keep-alive comments (None to disable)
+        """
+        subscription = self.subscribe(channel)
+        try:
+            for event, data in initial_events:
+                yield format_sse(event, data)
+
+            while True:
+                try:
+                    message = await asyncio.wait_for(
+                        subscription.queue.get(), timeout=heartbeat_seconds
+                    )
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield message
+        finally:
+            self.unsubscribe(subscription)
+
+
+# Per-user notification channel (keyed by user_id)
+notification_bus = EventBus()
@@ -0,0 +1,263 @@
+"""
+Mission Service
+Maintains the denormalized per-mission submission counters and bulk imports
+"""
+
+from sqlalchemy.orm import Session
+from sqlalchemy import func, select, insert, update
+from datetime import datetime
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple
+from fastapi import Depends
+from pydantic import ValidationError
+import codecs
+import csv
+import json
+import logging
+
+from app.core.config import settings
+from app.core.database import get_db, SessionLocal
+from app.models.category import Category
+from app.models.mission import Mission, MissionSubmission, MissionStatus
+from app.schemas.mission import MissionImportRow, MissionImportResult, MissionImportError
+
+logger = logging.getLogger(__name__)
+
+# Mission columns an import row may set
+IMPORT_FIELDS = (
+    "title", "description", "category_id", "difficulty", "points", "requirements",
+    "instructions", "requires_photo", "requires_file", "requires_description", "is_active"
+)
+
+
+def iter_import_rows(stream: BinaryIO, file_format: str) -> Iterator[Tuple[int, dict]]:
+    """
+    Parse an uploaded CSV or NDJSON file one record at a time.
+    
+    Args:
+        stream: Binary file object
+        file_format: "csv" or "ndjson"
+    
+    Yields:
+        (row number, raw field dict); a row that cannot be parsed yields an
+        "__error__" entry instead of raising
+    """
+    lines = codecs.getreader("utf-8-sig")(stream)
+    
+    if file_format == "csv":
+        reader = csv.DictReader(lines)
+        for row_number, row in enumerate(reader, start=2):  # Row 1 is the header
+            # Blank cells mean "use the default"
+            yield row_number, {
+                key.strip(): value.strip()
+                for key, value in row.items()
+                if key and value is not None and value.strip() != ""
+            }
+        return
+    
+    for row_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield row_number, {"__error__": f"Invalid JSON: {e.msg}"}
+            continue
+        if not isinstance(record, dict):
+            yield row_number, {"__error__": "Each line must be a JSON object"}
+            continue
+        yield row_number, record
+
+
+class MissionService:
+    """
+    Service for mission submission counters.
+    
+    Mission.submission_count and Mission.approved_count are shifted with
+    atomic increments in the caller's transaction whenever submissions are
+    created, approved or removed; methods never commit. reconcile_counters()
+    repairs any drift (e.g. rows removed by cascades or manual SQL).
+    """
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def adjust_counters(self, mission_id: int, submissions: int = 0, approved: int = 0) -> None:
+        """Atomically shift a mission's counters within the current transaction"""
+        values = {}
+        if submissions:
+            values[Mission.submission_count] = Mission.submission_count + submissions
+        if approved:
+            values[Mission.approved_count] = Mission.approved_count + approved
+        if values:
+            self.db.query(Mission).filter(Mission.id == mission_id).update(
+                values, synchronize_session=False
+            )
+    
+    def submissions_removed_for_team(self, team_id: int) -> None:
+        """Take a team's submissions out of the counters before the team is deleted"""
+        rows = self.db.query(
+            MissionSubmission.mission_id,
+            func.count(MissionSubmission.id).label("submissions"),
+            func.count(MissionSubmission.id).filter(
+                MissionSubmission.status == MissionStatus.APPROVED
+            ).label("approved")
+        ).filter(
+            MissionSubmission.team_id == team_id
+        ).group_by(MissionSubmission.mission_id).all()
+        
+        for row in sorted(rows, key=lambda r: r.mission_id):
+            self.adjust_counters(row.mission_id, -row.submissions, -row.approved)
+    
+    def import_missions(
+        self,
+        rows: Iterator[Tuple[int, dict]],
+        update_existing: bool = True,
+        batch_size: Optional[int] = None
+    ) -> MissionImportResult:
+        """
+        Validate and upsert missions from parsed import rows, batch by batch.
+        
+        Each batch costs one SELECT for existing titles, one bulk INSERT and
+        one bulk UPDATE (by primary key). Invalid rows are reported and
+        skipped. Nothing is committed; the caller owns the transaction.
+        
+        Args:
+            rows: (row number, raw fields) pairs, e.g. from iter_import_rows
+            update_existing: Update missions whose title already exists (else skip them)
+            batch_size: Rows per batch (defaults to MISSION_IMPORT_BATCH_SIZE)
+        
+        Returns:
+            Counts of created/updated/skipped missions and per-row errors
+        """
+        batch_size = batch_size or settings.MISSION_IMPORT_BATCH_SIZE
+        result = MissionImportResult()
+        
+        # Categories resolve by ID, slug or name
+        category_ids = set()
+        category_lookup: Dict[str, int] = {}
+        for category in self.db.query(Category.id, Category.slug, Category.name).all():
+            category_ids.add(category.id)
+            category_lookup[category.slug.lower()] = category.id
+            category_lookup[category.name.lower()] = category.id
+        
+        seen_titles: Dict[str, int] = {}
+        batch: List[Tuple[int, dict]] = []
+        
+        for row_number, raw in rows:
+            if "__error__" in raw:
+                result.errors.append(MissionImportError(row=row_number, error=raw["__error__"]))
+                continue
+            
+            if isinstance(raw.get("difficulty"), str):
+                raw["difficulty"] = raw["difficulty"].lower()
+            try:
+                parsed = MissionImportRow.model_validate(raw)
+            except ValidationError as e:
+                first = e.errors()[0]
+                field = ".".join(str(part) for part in first["loc"]) or "row"
+                result.errors.append(MissionImportError(row=row_number, error=f"{field}: {first['msg']}"))
+                continue
+            
+            category_id = parsed.category_id
+            if category_id is None and parsed.category:
+                category_id = category_lookup.get(parsed.category.strip().lower())
+            if category_id not in category_ids:
+                result.errors.append(MissionImportError(row=row_number, error="Category not found"))
+                continue
+            
+            title_key = parsed.title.strip().lower()
+            if title_key in seen_titles:
+                result.errors.append(MissionImportError(
+                    row=row_number,
+                    error=f"Duplicate title in file (first on row {seen_titles[title_key]})"
+                ))
+                continue
+            seen_titles[title_key] = row_number
+            
+            values = parsed.model_dump(include=set(IMPORT_FIELDS))
+            values["title"] = parsed.title.strip()
+            values["category_id"] = category_id
+            batch.append((row_number, values))
+            
+            if len(batch) >= batch_size:
+                self._write_import_batch(batch, update_existing, result)
+                batch = []
+        
+        if batch:
+            self._write_import_batch(batch, update_existing, result)
+        
+        return result
+    
+    def _write_import_batch(
+        self,
+        batch: List[Tuple[int, dict]],
+        update_existing: bool,
+        result: MissionImportResult
+    ) -> None:
+        """Upsert one batch of validated import rows by title"""
+        existing = {
+            title: mission_id
+            for mission_id, title in self.db.query(Mission.id, Mission.title).filter(
+                Mission.title.in_([values["title"] for _, values in batch])
+            ).all()
+        }
+        
+        now = datetime.utcnow()
+        new_rows = []
+        changed_rows = []
+        for _, values in batch:
+            mission_id = existing.get(values["title"])
+            if mission_id is None:
+                new_rows.append(values)
+            elif update_existing:
+                changed_rows.append({"id": mission_id, **values, "updated_at": now})
+            else:
+                result.skipped += 1
+        
+        if new_rows:
+            self.db.execute(insert(Mission), new_rows)
+        if changed_rows:
+            self.db.execute(update(Mission), changed_rows)
+        
+        result.created += len(new_rows)
+        result.updated += len(changed_rows)
+    
+    def reconcile_counters(self) -> int:
+        """
+        Recompute every mission's counters from mission_submissions.
+        
+        Returns:
+            Number of missions whose counters had drifted
+        """
+        submissions = select(func.count(MissionSubmission.id)).where(
+            MissionSubmission.mission_id == Mission.id
+        ).scalar_subquery()
+        approved = select(func.count(MissionSubmission.id)).where(
+            MissionSubmission.mission_id == Mission.id,
+            MissionSubmission.status == MissionStatus.APPROVED
+        ).scalar_subquery()
+        
+        drifted = self.db.query(Mission).filter(
+            (Mission.submission_count != submissions) | (Mission.approved_count != approved)
+        ).update({
+            Mission.submission_count: submissions,
+            Mission.approved_count: approved
+        }, synchronize_session=False)
+        self.db.commit()
+        return drifted
+
+
+def get_mission_service(db: Session = Depends(get_db)) -> MissionService:
+    """Dependency for getting mission service"""
+    return MissionService(db)
+
+
+def reconcile_mission_counters_job() -> None:
+    """Background job: repair drift in the per-mission submission counters"""
+    db = SessionLocal()
+    try:
+        drifted = MissionService(db).reconcile_counters()
+        if drifted:
+            logger.warning(f"🔧 Reconciled submission counters for {drifted} missions")
+    finally:
+        db.close()
@@ -4,13 +4,31 @@ Logic for creating and managing user notifications
 """
 
 from sqlalchemy.orm import Session
-from typing import List, Optional
-from datetime import datetime
+from sqlalchemy import func, case, select, insert, delete
+from typing import Callable, Dict, List, Optional, Tuple
+from datetime import datetime, timedelta
 from fastapi import Depends
+import logging
+import time
 
-from app.core.database import get_db
+from app.core.config import settings
+from app.core.database import get_db, SessionLocal
 from app.models.user import User
-from app.models.notification import Notification, NotificationType
+from app.models.notification import Notification, NotificationArchive, NotificationType
+from app.schemas.notification import NotificationResponse
+from app.services.event_bus import notification_bus
+
+logger = logging.getLogger(__name__)
+
+# In-process cache in front of User.unread_notifications: user_id -> (count, cached_at).
+# Writes through this process invalidate immediately; other workers see
+# changes once the TTL expires.
+_unread_count_cache: Dict[int, Tuple[int, float]] = {}
+UNREAD_COUNT_CACHE_TTL = 15  # seconds
+UNREAD_COUNT_CACHE_MAX_SIZE = 10000
+
+# Builds the (title, message) of a merged notification from its group size
+SummaryFormatter = Callable[[int], Tuple[str, str]]
 
 
 class NotificationService:
@@ -18,6 +36,7 @@ class NotificationService:
     
     def __init__(self, db: Session):
         self.db = db
+        self._batch: Optional[List[dict]] = None
     
     def create_notification(
         self,
@@ -27,9 +46,38 @@ class NotificationService:
         message: str,
         related_id: Optional[int] = None,
         related_type: Optional[str] = None,
-        action_url: Optional[str] = None
+        action_url: Optional[str] = None,
+        summary: Optional[SummaryFormatter] = None
     ) -> Notification:
-        """Create a new notification for a user"""
+        """
+        Create a new notification for a user.
+        
+        When `summary` is given, the notification may instead be merged into a
+        recent unread notification of the same type (see coalesce_notification).
+        While a batch is open (see start_batch) the notification is only
+        buffered and None is returned.
+        """
+        if self._batch is not None:
+            self._batch.append({
+                "user_id": user_id,
+                "type": notification_type,
+                "title": title,
+                "message": message,
+                "related_id": related_id,
+                "related_type": related_type,
+                "action_url": action_url,
+                "summary": summary
+            })
+            return None
+        
+        if summary is not None:
+            merged = self.coalesce_notification(
+                user_id, notification_type, summary,
+                related_id=related_id, related_type=related_type, action_url=action_url
+            )
+            if merged is not None:
+                return merged
+        
         notification = Notification(
             user_id=user_id,
             type=notification_type,
@@ -41,10 +89,135 @@ class NotificationService:
             is_read=False
         )
         self.db.add(notification)
+        self._adjust_unread_counter(user_id, 1)
         self.db.commit()
         self.db.refresh(notification)
+        self.publish_notification(notification)
+        self._unread_count_changed(user_id)
         return notification
     
+    def coalesce_notification(
+        self,
+        user_id: int,
+        notification_type: NotificationType,
+        summary: SummaryFormatter,
+        related_id: Optional[int] = None,
+        related_type: Optional[str] = None,
+        action_url: Optional[str] = None
+    ) -> Optional[Notification]:
+        """
+        Merge a new event into the user's latest unread notification of the same type.
+        
+        The candidate must have been active within NOTIFICATION_COALESCE_WINDOW_MINUTES,
+        or since midnight UTC for users in daily digest mode. It is updated in
+        place ("3 Missions Approved!") and moved to the top of the inbox, so
+        bursts add no rows and leave the unread counter unchanged.
+        
+        Returns:
+            The merged notification, or None if nothing could be merged
+        """
+        digest = self.db.query(User.notification_digest).filter(
+            User.id == user_id
+        ).scalar()
+        
+        now = datetime.utcnow()
+        if digest:
+            window_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        else:
+            window_start = now - timedelta(minutes=settings.NOTIFICATION_COALESCE_WINDOW_MINUTES)
+        
+        existing = self.db.query(Notification).filter(
+            Notification.user_id == user_id,
+            Notification.type == notification_type,
+            Notification.is_read == False,
+            Notification.created_at >= window_start
+        ).order_by(
+            Notification.created_at.desc()
+        ).with_for_update().first()
+        
+        if existing is None:
+            return None
+        
+        existing.group_count = (existing.group_count or 1) + 1
+        existing.title, existing.message = summary(existing.group_count)
+        existing.related_id = related_id
+        existing.related_type = related_type
+        existing.action_url = action_url
+        existing.created_at = func.now()
+        self.db.commit()
+        self.db.refresh(existing)
+        
+        # Digest users get the day's first event live; later merges wait for their next visit
+        if not digest:
+            self.publish_notification(existing)
+        return existing
+    
+    def start_batch(self) -> None:
+        """Buffer notifications created from now on instead of writing them one by one"""
+        self._batch = []
+    
+    def flush_batch(self) -> List[Notification]:
+        """
+        Write the buffered notifications in one batched INSERT, without committing.
+        
+        Buffered events of the same user and type that support summaries are
+        collapsed into a single grouped notification, and each user's unread
+        counter is bumped once. Call publish_notifications() after the commit.
+        
+        Returns:
+            The notifications added to the session
+        """
+        pending, self._batch = self._batch or [], None
+        
+        groups: Dict[object, List[dict]] = {}
+        for index, item in enumerate(pending):
+            key = (item["user_id"], item["type"]) if item["summary"] else index
+            groups.setdefault(key, []).append(item)
+        
+        notifications = []
+        unread_deltas: Dict[int, int] = {}
+        for items in groups.values():
+            latest = items[-1]
+            title, message = latest["title"], latest["message"]
+            if len(items) > 1:
+                title, message = latest["summary"](len(items))
+            notifications.append(Notification(
+                user_id=latest["user_id"],
+                type=latest["type"],
+                title=title,
+                message=message,
+                related_id=latest["related_id"],
+                related_type=latest["related_type"],
+                action_url=latest["action_url"],
+                group_count=len(items),
+                is_read=False
+            ))
+            unread_deltas[latest["user_id"]] = unread_deltas.get(latest["user_id"], 0) + 1
+        
+        if notifications:
+            self.db.add_all(notifications)
+            self.db.flush()
+            for user_id, delta in unread_deltas.items():
+                self._adjust_unread_counter(user_id, delta)
+        return notifications
+    
+    def publish_notifications(self, notifications: List[Notification]) -> None:
+        """Push committed notifications and the affected unread counts to live streams"""
+        for notification in notifications:
+            self.publish_notification(notification)
+        for user_id in {notification.user_id for notification in notifications}:
+            self._unread_count_changed(user_id)
+    
+    def publish_notification(self, notification: Notification) -> None:
+        """Push a committed notification to the user's live stream, if connected"""
+        if not notification_bus.has_subscribers(notification.user_id):
+            return
+        notification_bus.publish(
+            notification.user_id,
+            "notification",
+            NotificationResponse.model_validate(notification).model_dump()
+        )
+    
     def notify_mission_approved(
         self,
         user_id: int,
@@ -60,7 +233,11 @@ class NotificationService:
             message=f"Your submission for '{mission_title}' was approved. You earned {points} points!",
             related_id=mission_id,
             related_type="mission",
-            action_url=f"/missions/{mission_id}"
+            action_url=f"/missions/{mission_id}",
+            summary=lambda count: (
+                f"{count} Missions Approved! 🎉",
+                f"{count} of your submissions were approved, most recently '{mission_title}' (+{points} points)."
+            )
         )
     
     def notify_mission_rejected(
@@ -95,7 +272,11 @@ class NotificationService:
             message=f"Congratulations! You've earned the '{badge_name}' badge.",
             related_id=badge_id,
             related_type="badge",
-            action_url="/profile/badges"
+            action_url="/profile/badges",
+            summary=lambda count: (
+                f"{count} New Badges Earned! 🏆",
+                f"Congratulations! You've earned {count} new badges, including '{badge_name}'."
+            )
         )
     
     def notify_team_invite(
@@ -188,40 +369,197 @@ class NotificationService:
     
     def mark_as_read(self, notification_id: int, user_id: int) -> bool:
         """Mark a notification as read"""
-        notification = self.db.query(Notification).filter(
+        updated = self.db.query(Notification).filter(
             Notification.id == notification_id,
-            Notification.user_id == user_id
-        ).first()
+            Notification.user_id == user_id,
+            Notification.is_read == False
+        ).update({
+            "is_read": True,
+            "read_at": datetime.utcnow()
+        }, synchronize_session=False)
         
-        if not notification:
-            return False
+        if not updated:
+            # Either missing or already read
+            return self.db.query(Notification.id).filter(
+                Notification.id == notification_id,
+                Notification.user_id == user_id
+            ).first() is not None
         
-        notification.is_read = True
-        notification.read_at = datetime.utcnow()
+        self._adjust_unread_counter(user_id, -1)
         self.db.commit()
+        self._unread_count_changed(user_id)
         return True
     
     def mark_all_as_read(self, user_id: int) -> int:
         """Mark all notifications as read for a user"""
+        # Reset the counter first: the row lock serializes with concurrent creates
+        self.db.query(User).filter(User.id == user_id).update(
+            {User.unread_notifications: 0}, synchronize_session=False
+        )
         count = self.db.query(Notification).filter(
             Notification.user_id == user_id,
             Notification.is_read == False
         ).update({
             "is_read": True,
             "read_at": datetime.utcnow()
-        })
+        }, synchronize_session=False)
         self.db.commit()
+        self._unread_count_changed(user_id)
         return count
     
+    def delete_notification(self, notification_id: int, user_id: int) -> bool:
+        """Delete a notification, keeping the unread counter in sync"""
+        notification = self.db.query(Notification).filter(
+            Notification.id == notification_id,
+            Notification.user_id == user_id
+        ).first()
+        
+        if not notification:
+            return False
+        
+        was_unread = not notification.is_read
+        self.db.delete(notification)
+        if was_unread:
+            self._adjust_unread_counter(user_id, -1)
+        self.db.commit()
+        if was_unread:
+            self._unread_count_changed(user_id)
+        return True
+    
     def get_unread_count(self, user_id: int) -> int:
-        """Get count of unread notifications"""
-        from sqlalchemy import func
-        return self.db.query(func.count(Notification.id)).filter(
-            Notification.user_id == user_id,
-            Notification.is_read == False
+        """Get count of unread notifications (cached read of the user's counter)"""
+        cached = _unread_count_cache.get(user_id)
+        if cached and time.monotonic() - cached[1] < UNREAD_COUNT_CACHE_TTL:
+            return cached[0]
+        
+        count = self.db.query(User.unread_notifications).filter(
+            User.id == user_id
         ).scalar() or 0
+        
+        if len(_unread_count_cache) >= UNREAD_COUNT_CACHE_MAX_SIZE:
+            _unread_count_cache.clear()
+        _unread_count_cache[user_id] = (count, time.monotonic())
+        return count
+    
+    def sync_unread_counts(self, user_id: Optional[int] = None) -> None:
+        """
+        Recompute User.unread_notifications from the notifications table.
+        
+        Use to backfill the counter after a migration or repair drift.
+        Without user_id, every user is resynchronized in one UPDATE.
+        """
+        unread = select(func.count(Notification.id)).where(
+            Notification.user_id == User.id,
+            Notification.is_read == False
+        ).scalar_subquery()
+        
+        query = self.db.query(User)
+        if user_id is not None:
+            query = query.filter(User.id == user_id)
+        query.update({User.unread_notifications: unread}, synchronize_session=False)
+        self.db.commit()
+        
+        if user_id is None:
+            _unread_count_cache.clear()
+        else:
+            _unread_count_cache.pop(user_id, None)
+    
+    def prune_read_notifications(
+        self,
+        retention_days: int,
+        batch_size: int = 1000,
+        pause_seconds: float = 0.0,
+        archive: bool = True,
+        max_batches: Optional[int] = None
+    ) -> int:
+        """
+        Remove read notifications older than the retention window.
+        
+        Rows are handled in small primary-key batches, each in its own short
+        transaction, optionally copied to notifications_archive first.
+        Sleeping between batches keeps the job from competing with user traffic.
+        Unread notifications are never pruned, so the unread counters stay valid.
+        
+        Returns:
+            Number of notifications removed from the hot table
+        """
+        cutoff = datetime.utcnow() - timedelta(days=retention_days)
+        archived_columns = [
+            "id", "user_id", "type", "title", "message", "related_id",
+            "related_type", "action_url", "is_read", "created_at", "read_at"
+        ]
+        
+        total = 0
+        batches = 0
+        while max_batches is None or batches < max_batches:
+            ids = [
+                row.id for row in self.db.query(Notification.id).filter(
+                    Notification.is_read == True,
+                    Notification.created_at < cutoff
+                ).order_by(Notification.id).limit(batch_size).all()
+            ]
+            if not ids:
+                break
+            
+            if archive:
+                self.db.execute(
+                    insert(NotificationArchive).from_select(
+                        archived_columns,
+                        select(*[getattr(Notification, c) for c in archived_columns]).where(
+                            Notification.id.in_(ids)
+                        )
+                    )
+                )
+            self.db.execute(
+                delete(Notification).where(Notification.id.in_(ids)),
+                execution_options={"synchronize_session": False}
+            )
+            self.db.commit()
+            
+            total += len(ids)
+            batches += 1
+            if len(ids) < batch_size:
+                break
+            if pause_seconds:
+                time.sleep(pause_seconds)
+        
+        return total
+    
+    def _adjust_unread_counter(self, user_id: int, delta: int) -> None:
+        """Atomically shift a user's unread counter within the current transaction"""
+        new_value = User.unread_notifications + delta
+        self.db.query(User).filter(User.id == user_id).update(
+            {User.unread_notifications: case((new_value > 0, new_value), else_=0)},
+            synchronize_session=False
+        )
+    
+    def _unread_count_changed(self, user_id: int) -> None:
+        """Invalidate the cached count and push the new value to live streams"""
+        _unread_count_cache.pop(user_id, None)
+        if notification_bus.has_subscribers(user_id):
+            notification_bus.publish(
+                user_id,
+                "unread_count",
+                {"unread_count": self.get_unread_count(user_id)}
+            )
 
 
 def get_notification_service(db: Session = Depends(get_db)) -> NotificationService:
     """Dependency for getting notification service"""
     return NotificationService(db)
+
+
+def prune_notifications_job() -> None:
+    """Background job: apply the notification retention policy"""
+    db = SessionLocal()
+    try:
+        removed = NotificationService(db).prune_read_notifications(
+            retention_days=settings.NOTIFICATION_RETENTION_DAYS,
+            batch_size=settings.NOTIFICATION_PRUNE_BATCH_SIZE,
+            pause_seconds=settings.NOTIFICATION_PRUNE_PAUSE_SECONDS,
+            archive=settings.NOTIFICATION_ARCHIVE_ENABLED
+        )
+        if removed:
+            logger.info(f"🧹 Pruned {removed} read notifications older than {settings.NOTIFICATION_RETENTION_DAYS} days")
+    finally:
+        db.close()
@@ -0,0 +1,366 @@
+"""
+Points Service
+Writes the append-only points ledger and maintains the running totals derived from it
+"""
+
+from sqlalchemy.orm import Session
+from sqlalchemy import func, select, insert, union_all
+from typing import Dict, List, Optional, Tuple
+from collections import defaultdict
+from datetime import datetime, timedelta
+from fastapi import Depends
+import logging
+
+from app.core.config import settings
+from app.core.database import get_db, SessionLocal
+from app.models.user import User
+from app.models.team import Team
+from app.models.mission import Mission, MissionSubmission
+from app.models.points import PointsLedgerEntry, PointsCheckpoint, PointsEntryType
+
+logger = logging.getLogger(__name__)
+
+
+class PointsService:
+    """
+    Service for recording point movements.
+    
+    The ledger is the source of truth. Team.total_points, Team.missions_completed
+    and User.total_points are running totals updated with atomic increments in
+    the same transaction as each ledger entry. Methods never commit; callers
+    own the transaction.
+    """
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def record_entry(
+        self,
+        team_id: int,
+        points: int,
+        entry_type: PointsEntryType,
+        missions_delta: int = 0,
+        user_id: Optional[int] = None,
+        submission_id: Optional[int] = None,
+        mission_id: Optional[int] = None,
+        reason: Optional[str] = None,
+        created_by: Optional[int] = None
+    ) -> PointsLedgerEntry:
+        """Append a ledger entry and apply it to the running totals"""
+        entry = PointsLedgerEntry(
+            team_id=team_id,
+            user_id=user_id,
+            entry_type=entry_type,
+            submission_id=submission_id,
+            mission_id=mission_id,
+            reason=reason,
+            created_by=created_by,
+            points=points,
+            missions_delta=missions_delta
+        )
+        self.db.add(entry)
+        
+        self.db.query(Team).filter(Team.id == team_id).update({
+            Team.total_points: Team.total_points + points,
+            Team.missions_completed: Team.missions_completed + missions_delta
+        }, synchronize_session=False)
+        
+        if user_id is not None and points:
+            self.db.query(User).filter(User.id == user_id).update({
+                User.total_points: User.total_points + points
+            }, synchronize_session=False)
+        
+        return entry
+    
+    def award_submission(
+        self,
+        submission: MissionSubmission,
+        mission: Mission,
+        awarded_by: Optional[int] = None
+    ) -> PointsLedgerEntry:
+        """Record the points of an approved submission, at the mission's current value"""
+        return self.record_entry(
+            team_id=submission.team_id,
+            points=mission.points,
+            entry_type=PointsEntryType.AWARD,
+            missions_delta=1,
+            user_id=submission.submitted_by,
+            submission_id=submission.id,
+            mission_id=mission.id,
+            created_by=awarded_by
+        )
+    
+    def award_submissions(
+        self,
+        awards: List[Tuple[MissionSubmission, Mission]],
+        awarded_by: Optional[int] = None
+    ) -> int:
+        """
+        Record many approvals at once (e.g. a batch review).
+        
+        Writes all ledger entries in one bulk insert, then applies one totals
+        update per team and per user instead of one per submission.
+        
+        Returns:
+            Number of ledger entries written
+        """
+        if not awards:
+            return 0
+        
+        rows = []
+        team_deltas: Dict[int, List[int]] = defaultdict(lambda: [0, 0])
+        user_deltas: Dict[int, int] = defaultdict(int)
+        for submission, mission in awards:
+            rows.append({
+                "team_id": submission.team_id,
+                "user_id": submission.submitted_by,
+                "entry_type": PointsEntryType.AWARD,
+                "submission_id": submission.id,
+                "mission_id": mission.id,
+                "created_by": awarded_by,
+                "points": mission.points,
+                "missions_delta": 1
+            })
+            team_deltas[submission.team_id][0] += mission.points
+            team_deltas[submission.team_id][1] += 1
+            if submission.submitted_by is not None:
+                user_deltas[submission.submitted_by] += mission.points
+        
+        self.db.execute(insert(PointsLedgerEntry), rows)
+        
+        # Sorted so concurrent batches lock rows in the same order
+        for team_id in sorted(team_deltas):
+            points, missions = team_deltas[team_id]
+            self.db.query(Team).filter(Team.id == team_id).update({
+                Team.total_points: Team.total_points + points,
+                Team.missions_completed: Team.missions_completed + missions
+            }, synchronize_session=False)
+        for user_id in sorted(user_deltas):
+            if user_deltas[user_id]:
+                self.db.query(User).filter(User.id == user_id).update({
+                    User.total_points: User.total_points + user_deltas[user_id]
+                }, synchronize_session=False)
+        
+        return len(rows)
+    
+    def adjust_team(
+        self,
+        team_id: int,
+        points: int = 0,
+        missions_delta: int = 0,
+        reason: Optional[str] = None,
+        created_by: Optional[int] = None
+    ) -> PointsLedgerEntry:
+        """Record a manual correction to a team's totals"""
+        return self.record_entry(
+            team_id=team_id,
+            points=points,
+            entry_type=PointsEntryType.ADJUSTMENT,
+            missions_delta=missions_delta,
+            reason=reason,
+            created_by=created_by
+        )
+    
+    def write_checkpoint(self, settle_seconds: int = 60) -> int:
+        """
+        Fold new ledger entries into checkpoint rows for the teams they touch.
+        
+        Only the contiguous run of entries older than `settle_seconds` is
+        folded, so transactions that were still open when an ID was handed out
+        have committed, and everything folded predates the checkpoint's
+        settled_at. Each run costs one aggregate over the entries since the
+        last checkpoint.
+        
+        Returns:
+            Number of team checkpoint rows written
+        """
+        last_checkpoint = self.db.query(
+            func.coalesce(func.max(PointsCheckpoint.ledger_id), 0)
+        ).scalar()
+        
+        settled_before = datetime.utcnow() - timedelta(seconds=settle_seconds)
+        first_unsettled = self.db.query(func.min(PointsLedgerEntry.id)).filter(
+            PointsLedgerEntry.id > last_checkpoint,
+            PointsLedgerEntry.created_at > settled_before
+        ).scalar()
+        
+        upper_query = self.db.query(func.max(PointsLedgerEntry.id)).filter(
+            PointsLedgerEntry.id > last_checkpoint
+        )
+        if first_unsettled is not None:
+            upper_query = upper_query.filter(PointsLedgerEntry.id < first_unsettled)
+        upper = upper_query.scalar()
+        if upper is None:
+            return 0
+        
+        deltas = self.db.query(
+            PointsLedgerEntry.team_id,
+            func.sum(PointsLedgerEntry.points).label("points"),
+            func.sum(PointsLedgerEntry.missions_delta).label("missions")
+        ).filter(
+            PointsLedgerEntry.id > last_checkpoint,
+            PointsLedgerEntry.id <= upper
+        ).group_by(PointsLedgerEntry.team_id).all()
+        
+        # Each team's previous checkpoint row
+        latest = select(
+            PointsCheckpoint.team_id,
+            func.max(PointsCheckpoint.ledger_id).label("ledger_id")
+        ).where(
+            PointsCheckpoint.team_id.in_([d.team_id for d in deltas])
+        ).group_by(PointsCheckpoint.team_id).subquery()
+        previous = {
+            row.team_id: row for row in self.db.query(PointsCheckpoint).join(
+                latest,
+                (PointsCheckpoint.team_id == latest.c.team_id) &
+                (PointsCheckpoint.ledger_id == latest.c.ledger_id)
+            ).all()
+        }
+        
+        rows = []
+        for delta in deltas:
+            prev = previous.get(delta.team_id)
+            rows.append({
+                "ledger_id": upper,
+                "team_id": delta.team_id,
+                "total_points": (prev.total_points if prev else 0) + int(delta.points or 0),
+                "missions_completed": (prev.missions_completed if prev else 0) + int(delta.missions or 0),
+                "settled_at": settled_before
+            })
+        
+        if rows:
+            self.db.execute(insert(PointsCheckpoint), rows)
+        self.db.commit()
+        return len(rows)
+    
+    def team_totals_as_of(self, as_of: datetime):
+        """
+        Build a subquery of each team's totals as they stood at `as_of`.
+        
+        Starts from the latest checkpoint settled by then and adds only the
+        ledger entries recorded between that checkpoint and `as_of`, so the
+        cost is bounded by one checkpoint interval rather than all history.
+        
+        Args:
+            as_of: Point in time (naive UTC)
+        
+        Returns:
+            Subquery with team_id, total_points and missions_completed columns
+        """
+        checkpoint = self.db.query(
+            PointsCheckpoint.ledger_id, PointsCheckpoint.settled_at
+        ).filter(
+            PointsCheckpoint.settled_at <= as_of
+        ).order_by(
+            PointsCheckpoint.settled_at.desc(), PointsCheckpoint.ledger_id.desc()
+        ).first()
+        
+        parts = []
+        deltas = select(
+            PointsLedgerEntry.team_id,
+            func.sum(PointsLedgerEntry.points).label("points"),
+            func.sum(PointsLedgerEntry.missions_delta).label("missions")
+        ).where(
+            PointsLedgerEntry.created_at <= as_of
+        )
+        
+        if checkpoint:
+            # Each team's latest row at or below the chosen checkpoint
+            latest = select(
+                PointsCheckpoint.team_id,
+                func.max(PointsCheckpoint.ledger_id).label("ledger_id")
+            ).where(
+                PointsCheckpoint.ledger_id <= checkpoint.ledger_id
+            ).group_by(PointsCheckpoint.team_id).subquery()
+            parts.append(
+                select(
+                    PointsCheckpoint.team_id,
+                    PointsCheckpoint.total_points.label("points"),
+                    PointsCheckpoint.missions_completed.label("missions")
+                ).join(
+                    latest,
+                    (PointsCheckpoint.team_id == latest.c.team_id) &
+                    (PointsCheckpoint.ledger_id == latest.c.ledger_id)
+                )
+            )
+            deltas = deltas.where(
+                PointsLedgerEntry.id > checkpoint.ledger_id,
+                PointsLedgerEntry.created_at > checkpoint.settled_at
+            )
+        
+        parts.append(deltas.group_by(PointsLedgerEntry.team_id))
+        combined = union_all(*parts).subquery()
+        
+        return select(
+            combined.c.team_id,
+            func.sum(combined.c.points).label("total_points"),
+            func.sum(combined.c.missions).label("missions_completed")
+        ).group_by(combined.c.team_id).subquery()
+    
+    def team_totals_between(self, start: datetime, end: Optional[datetime] = None):
+        """
+        Build a subquery of the points each team earned between two points in time.
+        
+        Computed as the difference of two point-in-time totals (or of the
+        running totals and one of them when `end` is open), so it never scans
+        more than a checkpoint interval of the ledger per bound.
+        
+        Args:
+            start: Start of the period (naive UTC)
+            end: End of the period (naive UTC), or None for "up to now"
+        
+        Returns:
+            Subquery with team_id, total_points and missions_completed columns
+        """
+        before = self.team_totals_as_of(start)
+        if end is None:
+            after = select(
+                Team.id.label("team_id"),
+                Team.total_points.label("total_points"),
+                Team.missions_completed.label("missions_completed")
+            ).subquery()
+        else:
+            after = self.team_totals_as_of(end)
+        
+        return select(
+            after.c.team_id,
+            (after.c.total_points - func.coalesce(before.c.total_points, 0)).label("total_points"),
+            (after.c.missions_completed - func.coalesce(before.c.missions_completed, 0)).label("missions_completed")
+        ).outerjoin(
+            before, after.c.team_id == before.c.team_id
+        ).subquery()
+    
+    def rebuild_totals(self) -> None:
+        """Recompute every team and user running total from the full ledger (repair tool)"""
+        team_points = select(func.coalesce(func.sum(PointsLedgerEntry.points), 0)).where(
+            PointsLedgerEntry.team_id == Team.id
+        ).scalar_subquery()
+        team_missions = select(func.coalesce(func.sum(PointsLedgerEntry.missions_delta), 0)).where(
+            PointsLedgerEntry.team_id == Team.id
+        ).scalar_subquery()
+        user_points = select(func.coalesce(func.sum(PointsLedgerEntry.points), 0)).where(
+            PointsLedgerEntry.user_id == User.id
+        ).scalar_subquery()
+        
+        self.db.query(Team).update({
+            Team.total_points: team_points,
+            Team.missions_completed: team_missions
+        }, synchronize_session=False)
+        self.db.query(User).update({User.total_points: user_points}, synchronize_session=False)
+        self.db.commit()
+
+
+def get_points_service(db: Session = Depends(get_db)) -> PointsService:
+    """Dependency for getting points service"""
+    return PointsService(db)
+
+
+def checkpoint_points_job() -> None:
+    """Background job: checkpoint team totals from recent ledger entries"""
+    db = SessionLocal()
+    try:
+        written = PointsService(db).write_checkpoint(settings.POINTS_CHECKPOINT_SETTLE_SECONDS)
+        if written:
+            logger.info(f"📒 Checkpointed points for {written} teams")
+    finally:
+        db.close()
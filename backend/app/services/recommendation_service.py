@@ -0,0 +1,178 @@
+"""
+Recommendation Service
+Batch-computes "next missions" suggestions for every team
+"""
+
+from sqlalchemy.orm import Session
+from sqlalchemy import insert
+from typing import Dict, List, Optional, Set
+from collections import Counter, defaultdict
+from datetime import datetime
+from fastapi import Depends
+import heapq
+import logging
+import math
+
+from app.core.config import settings
+from app.core.database import get_db, SessionLocal
+from app.models.team import Team
+from app.models.mission import Mission, MissionSubmission, MissionStatus, MissionDifficulty
+from app.models.recommendation import TeamRecommendation
+
+logger = logging.getLogger(__name__)
+
+# Relative weight of each signal in a recommendation score
+SCORE_WEIGHTS = {
+    "category": 0.4,
+    "difficulty": 0.25,
+    "similar_teams": 0.25,
+    "popular": 0.1
+}
+
+DIFFICULTY_RANK = {
+    MissionDifficulty.EASY: 0,
+    MissionDifficulty.MEDIUM: 1,
+    MissionDifficulty.HARD: 2,
+    MissionDifficulty.EXPERT: 3
+}
+
+# How far above a team's average completed difficulty the sweet spot sits
+DIFFICULTY_STEP = 0.5
+
+
+class RecommendationService:
+    """Service for building and reading per-team mission recommendations"""
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def compute_all(self, per_team: Optional[int] = None) -> int:
+        """
+        Rebuild the stored recommendations for every team.
+        
+        Scores each active mission a team has not attempted:
+        - category: how often the team completed missions in its category
+        - difficulty: closeness to one step above the team's usual difficulty
+        - similar_teams: co-occurrence with the team's completed missions
+          across all teams (cosine-normalized)
+        - popular: how many teams completed it
+        
+        Co-occurrence is kept as a sparse mission -> mission counter, so the
+        cost grows with completed pairs rather than missions squared.
+        
+        Args:
+            per_team: Suggestions kept per team (defaults to RECOMMENDATIONS_PER_TEAM)
+        
+        Returns:
+            Number of teams processed
+        """
+        per_team = per_team or settings.RECOMMENDATIONS_PER_TEAM
+        
+        missions = {
+            mission.id: mission
+            for mission in self.db.query(
+                Mission.id, Mission.category_id, Mission.difficulty
+            ).filter(Mission.is_active == True).all()
+        }
+        
+        completed: Dict[int, Set[int]] = defaultdict(set)
+        attempted: Dict[int, Set[int]] = defaultdict(set)
+        for team_id, mission_id, submission_status in self.db.query(
+            MissionSubmission.team_id, MissionSubmission.mission_id, MissionSubmission.status
+        ).filter(
+            MissionSubmission.status.in_([MissionStatus.PENDING, MissionStatus.APPROVED])
+        ).all():
+            attempted[team_id].add(mission_id)
+            if submission_status == MissionStatus.APPROVED:
+                completed[team_id].add(mission_id)
+        
+        # Sparse co-occurrence: teams that completed both missions
+        completions: Counter = Counter()
+        co_occurrence: Dict[int, Counter] = defaultdict(Counter)
+        for done in completed.values():
+            completions.update(done)
+            for first in done:
+                for second in done:
+                    if first != second:
+                        co_occurrence[first][second] += 1
+        max_completions = max(completions.values(), default=0)
+        
+        now = datetime.utcnow()
+        rows = []
+        team_ids = [team_id for (team_id,) in self.db.query(Team.id).all()]
+        for team_id in team_ids:
+            done = completed.get(team_id, set())
+            skip = attempted.get(team_id, set())
+            
+            category_counts = Counter(
+                missions[mission_id].category_id for mission_id in done if mission_id in missions
+            )
+            max_category = max(category_counts.values(), default=0)
+            
+            ranks = [DIFFICULTY_RANK[missions[mission_id].difficulty] for mission_id in done if mission_id in missions]
+            target = min(sum(ranks) / len(ranks) + DIFFICULTY_STEP, 3) if ranks else 0
+            
+            similar: Counter = Counter()
+            for mission_id in done:
+                for other_id, both in co_occurrence.get(mission_id, {}).items():
+                    if other_id not in skip:
+                        similar[other_id] += both / math.sqrt(completions[mission_id] * completions[other_id])
+            max_similar = max(similar.values(), default=0)
+            
+            scored = []
+            for mission_id, mission in missions.items():
+                if mission_id in skip:
+                    continue
+                parts = {
+                    "category": category_counts[mission.category_id] / max_category if max_category else 0,
+                    "difficulty": 1 - abs(DIFFICULTY_RANK[mission.difficulty] - target) / 3,
+                    "similar_teams": similar[mission_id] / max_similar if max_similar else 0,
+                    "popular": completions[mission_id] / max_completions if max_completions else 0
+                }
+                weighted = {name: SCORE_WEIGHTS[name] * value for name, value in parts.items()}
+                scored.append((sum(weighted.values()), -mission_id, max(weighted, key=weighted.get)))
+            
+            for rank, (score, negative_id, reason) in enumerate(heapq.nlargest(per_team, scored), start=1):
+                rows.append({
+                    "team_id": team_id,
+                    "mission_id": -negative_id,
+                    "rank": rank,
+                    "score": round(score, 4),
+                    "reason": reason,
+                    "computed_at": now
+                })
+        
+        self.db.query(TeamRecommendation).delete(synchronize_session=False)
+        if rows:
+            self.db.execute(insert(TeamRecommendation), rows)
+        self.db.commit()
+        
+        return len(team_ids)
+    
+    def get_for_team(self, team_id: int, limit: int) -> List[TeamRecommendation]:
+        """Stored recommendations for a team, best first"""
+        return self.db.query(TeamRecommendation).filter(
+            TeamRecommendation.team_id == team_id
+        ).order_by(TeamRecommendation.rank).limit(limit).all()
+    
+    def discard(self, team_id: int, mission_id: int) -> None:
+        """Drop a suggestion the team has acted on (no commit)"""
+        self.db.query(TeamRecommendation).filter(
+            TeamRecommendation.team_id == team_id,
+            TeamRecommendation.mission_id == mission_id
+        ).delete(synchronize_session=False)
+
+
+def get_recommendation_service(db: Session = Depends(get_db)) -> RecommendationService:
+    """Dependency for getting recommendation service"""
+    return RecommendationService(db)
+
+
+def compute_recommendations_job() -> None:
+    """Background job: rebuild every team's mission recommendations"""
+    db = SessionLocal()
+    try:
+        teams = RecommendationService(db).compute_all()
+        logger.info(f"🧭 Rebuilt mission recommendations for {teams} teams")
+    finally:
+        db.close()
@@ -0,0 +1,150 @@
+"""
+Reference Data Cache
+Process-wide in-memory copy of missions and categories, invalidated by version
+"""
+
+from sqlalchemy.orm import Session
+from sqlalchemy import insert
+from typing import Dict, List, Optional
+import logging
+import threading
+import time
+
+from app.core.config import settings
+from app.models.category import Category
+from app.models.mission import Mission
+from app.models.reference import ReferenceDataVersion
+
+logger = logging.getLogger(__name__)
+
+REFERENCE_VERSION_NAME = "missions"
+
+
+class ReferenceSnapshot:
+    """Immutable view of missions and categories at one version"""
+    
+    def __init__(self, version: int, missions: List[dict], categories: List[dict]):
+        self.version = version
+        # Newest first, the order listings are served in
+        self.missions = missions
+        self.missions_by_id: Dict[int, dict] = {m["id"]: m for m in missions}
+        self.categories_by_id: Dict[int, dict] = {c["id"]: c for c in categories}
+    
+    def etag(self, *parts) -> str:
+        """ETag for a response derived from this snapshot (plus any extra parts)"""
+        suffix = "".join(f"-{part}" for part in parts)
+        return f'"ref-{self.version}{suffix}"'
+
+
+class ReferenceDataCache:
+    """
+    Missions and categories kept in memory for every read in this process.
+    
+    Writers bump a shared version row in the same transaction as their change
+    (bump) and drop the local copy after committing (invalidate). Other
+    workers compare the shared version at most every
+    REFERENCE_CACHE_CHECK_SECONDS and reload when it moved; a full reload is
+    also forced after REFERENCE_CACHE_MAX_AGE_SECONDS to pick up
+    out-of-band edits.
+    """
+    
+    def __init__(self):
+        self._snapshot: Optional[ReferenceSnapshot] = None
+        self._loaded_at = 0.0
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+    
+    def snapshot(self, db: Session) -> ReferenceSnapshot:
+        """Get the current snapshot, reloading it if another worker changed the data"""
+        now = time.monotonic()
+        current = self._snapshot
+        if (current is not None
+                and now - self._checked_at < settings.REFERENCE_CACHE_CHECK_SECONDS
+                and now - self._loaded_at < settings.REFERENCE_CACHE_MAX_AGE_SECONDS):
+            return current
+        
+        with self._lock:
+            version = self._read_version(db)
+            current = self._snapshot
+            if (current is None
+                    or current.version != version
+                    or now - self._loaded_at >= settings.REFERENCE_CACHE_MAX_AGE_SECONDS):
+                current = self._load(db, version)
+                self._snapshot = current
+                self._loaded_at = now
+            self._checked_at = now
+            return current
+    
+    def get_mission(self, db: Session, mission_id: int) -> Optional[dict]:
+        """Look up a mission by ID"""
+        return self.snapshot(db).missions_by_id.get(mission_id)
+    
+    def get_category(self, db: Session, category_id: int) -> Optional[dict]:
+        """Look up a category by ID"""
+        return self.snapshot(db).categories_by_id.get(category_id)
+    
+    def bump(self, db: Session) -> None:
+        """Advance the shared version in the caller's transaction (call before commit)"""
+        updated = db.query(ReferenceDataVersion).filter(
+            ReferenceDataVersion.name == REFERENCE_VERSION_NAME
+        ).update({
+            ReferenceDataVersion.version: ReferenceDataVersion.version + 1
+        }, synchronize_session=False)
+        if not updated:
+            db.execute(insert(ReferenceDataVersion).values(name=REFERENCE_VERSION_NAME, version=1))
+    
+    def invalidate(self) -> None:
+        """Drop this process's copy (call after the bumping transaction committed)"""
+        with self._lock:
+            self._snapshot = None
+    
+    def _read_version(self, db: Session) -> int:
+        """Read the shared version (one primary-key lookup)"""
+        return db.query(ReferenceDataVersion.version).filter(
+            ReferenceDataVersion.name == REFERENCE_VERSION_NAME
+        ).scalar() or 0
+    
+    def _load(self, db: Session, version: int) -> ReferenceSnapshot:
+        """Read all missions and categories into a new snapshot"""
+        categories = [
+            {
+                "id": category.id,
+                "name": category.name,
+                "slug": category.slug,
+                "description": category.description,
+                "icon": category.icon,
+                "color": category.color
+            }
+            for category in db.query(Category).all()
+        ]
+        category_names = {c["id"]: c["name"] for c in categories}
+        
+        missions = [
+            {
+                "id": mission.id,
+                "title": mission.title,
+                "description": mission.description,
+                "category_id": mission.category_id,
+                "category": {
+                    "id": mission.category_id,
+                    "name": category_names.get(mission.category_id)
+                } if mission.category_id in category_names else None,
+                "difficulty": mission.difficulty,
+                "points": mission.points,
+                "requires_photo": mission.requires_photo,
+                "requires_file": mission.requires_file,
+                "requires_description": mission.requires_description,
+                "is_active": mission.is_active,
+                "created_at": mission.created_at
+            }
+            for mission in db.query(Mission).order_by(
+                Mission.created_at.desc(), Mission.id.desc()
+            ).all()
+        ]
+        
+        logger.debug(f"📦 Loaded reference data v{version}: {len(missions)} missions, {len(categories)} categories")
+        return ReferenceSnapshot(version, missions, categories)
+
+
+# Process-wide reference data cache
+reference_cache = ReferenceDataCache()
@@ -0,0 +1,59 @@
+"""
+Background Scheduler
+Runs periodic maintenance jobs inside the API process
+"""
+
+import asyncio
+import logging
+from typing import Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicJob:
+    """A synchronous job executed every `interval_seconds` in a worker thread"""
+
+    def __init__(self, name: str, interval_seconds: float, func: Callable[[], None]):
+        self.name = name
+        self.interval_seconds = interval_seconds
+        self.func = func
+        self.task: Optional[asyncio.Task] = None
+
+    async def run_forever(self) -> None:
+        """Run the job, wait, repeat; errors are logged and never stop the loop"""
+        while True:
+            try:
+                await asyncio.to_thread(self.func)
+            except Exception:
+                logger.exception(f"Background job '{self.name}' failed")
+            await asyncio.sleep(self.interval_seconds)
+
+
+class Scheduler:
+    """Registry of periodic jobs started and stopped with the application lifespan"""
+
+    def __init__(self):
+        self.jobs: List[PeriodicJob] = []
+
+    def register(self, name: str, interval_seconds: float, func: Callable[[], None]) -> None:
+        """Register a job to be started with the scheduler"""
+        self.jobs.append(PeriodicJob(name, interval_seconds, func))
+
+    def start(self) -> None:
+        """Start all registered jobs on the running event loop"""
+        for job in self.jobs:
+            if job.task is None:
+                job.task = asyncio.create_task(job.run_forever(), name=job.name)
+                logger.info(f"⏱️  Background job '{job.name}' every {job.interval_seconds}s")
+
+    async def stop(self) -> None:
+        """Cancel all running jobs and wait for them to finish"""
+        tasks = [job.task for job in self.jobs if job.task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for job in self.jobs:
+            job.task = None
+
+
+scheduler = Scheduler()
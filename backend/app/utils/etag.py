@@ -0,0 +1,26 @@
+"""
+ETag helpers
+Conditional GET support for cacheable read endpoints
+"""
+
+from fastapi import Request
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """
+    Check whether the client's If-None-Match header already covers an ETag.
+    
+    Args:
+        request: Incoming request
+        etag: Current ETag of the resource (quoted)
+    
+    Returns:
+        True if the client copy is current and a 304 can be sent
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    candidates = [tag.strip() for tag in header.split(",")]
+    return etag in candidates or f"W/{etag}" in candidates
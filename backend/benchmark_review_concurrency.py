@@ -0,0 +1,188 @@
+"""
+NIRD Platform - Concurrent Review Benchmark
+Hammers the review endpoint with parallel reviewers and checks team totals
+"""
+
+import requests
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
+
+BASE_URL = "http://127.0.0.1:8000/api"
+
+NUM_REVIEWERS = 8
+NUM_MISSIONS = 50
+POINTS_PER_MISSION = 10
+
+
+def clean_database():
+    """Clean database before running the benchmark"""
+    print("🧹 Cleaning database...")
+    try:
+        subprocess.run(
+            [
+                "docker", "exec", "nird_postgres", "psql",
+                "-U", "nird_user", "-d", "nird_db",
+                "-c", "TRUNCATE TABLE notifications, mission_submissions, missions, team_members, teams, user_badges, badges, users, schools, categories RESTART IDENTITY CASCADE;"
+            ],
+            capture_output=True,
+            text=True,
+            check=True
+        )
+        subprocess.run(
+            [
+                "docker", "exec", "nird_postgres", "psql",
+                "-U", "nird_user", "-d", "nird_db",
+                "-c", "INSERT INTO categories (name, slug, description) VALUES ('General', 'general', 'General missions');"
+            ],
+            capture_output=True,
+            text=True,
+            check=True
+        )
+        print("  ✓ Database cleaned successfully")
+        return True
+    except subprocess.CalledProcessError as e:
+        print(f"  ✗ Failed to clean database: {e.stderr}")
+        return False
+    except FileNotFoundError:
+        print("  ✗ Docker not found. Please ensure Docker is installed and running.")
+        return False
+
+
+def print_section(title: str):
+    """Print section header"""
+    print(f"\n{'='*70}")
+    print(f"  {title}")
+    print(f"{'='*70}\n")
+
+
+def print_result(success: bool, message: str):
+    """Print benchmark result"""
+    symbol = "✓" if success else "✗"
+    print(f"  {symbol} {message}")
+
+
+def register_and_login(username: str, password: str, role: str = "student") -> Optional[str]:
+    """Register a user and return an access token"""
+    requests.post(f"{BASE_URL}/auth/register", json={
+        "username": username,
+        "email": f"{username}@example.com",
+        "password": password,
+        "full_name": username.title(),
+        "role": role
+    })
+    response = requests.post(f"{BASE_URL}/auth/login", data={
+        "username": username,
+        "password": password
+    })
+    if response.status_code != 200:
+        print_result(False, f"Login failed for {username}: {response.status_code}")
+        return None
+    return response.json()["access_token"]
+
+
+def auth(token: str) -> Dict[str, str]:
+    """Authorization header for a token"""
+    return {"Authorization": f"Bearer {token}"}
+
+
+def review(submission_id: int, token: str) -> int:
+    """Approve a submission, returning the HTTP status code"""
+    response = requests.post(
+        f"{BASE_URL}/missions/submissions/{submission_id}/review",
+        headers=auth(token),
+        json={"status": "approved", "review_comment": "Approved under load"}
+    )
+    return response.status_code
+
+
+def main():
+    """Run the concurrent review benchmark"""
+    print_section("⚡ NIRD Platform Concurrent Review Benchmark")
+
+    if not clean_database():
+        print("\n❌ Failed to clean database. Exiting.")
+        return
+
+    # Setup
+    print_section("Setup")
+    reviewer_tokens = [
+        register_and_login(f"reviewer{i}", "password123", "teacher")
+        for i in range(NUM_REVIEWERS)
+    ]
+    student_token = register_and_login("student1", "password123", "student")
+    if not all(reviewer_tokens) or not student_token:
+        print("❌ Failed to create users")
+        return
+
+    response = requests.post(
+        f"{BASE_URL}/teams",
+        headers=auth(student_token),
+        json={"name": "Load Testers", "description": "Benchmark team"}
+    )
+    if response.status_code != 201:
+        print(f"❌ Failed to create team: {response.status_code}")
+        return
+    team_id = response.json()["id"]
+
+    submission_ids = []
+    for i in range(NUM_MISSIONS):
+        mission = requests.post(
+            f"{BASE_URL}/missions",
+            headers=auth(reviewer_tokens[0]),
+            json={
+                "title": f"Benchmark Mission {i}",
+                "description": "Concurrency benchmark",
+                "category_id": 1,
+                "difficulty": "easy",
+                "points": POINTS_PER_MISSION
+            }
+        ).json()
+        submission = requests.post(
+            f"{BASE_URL}/missions/{mission['id']}/submit",
+            headers=auth(student_token),
+            json={"description": "Benchmark submission"}
+        ).json()
+        submission_ids.append(submission["id"])
+    print_result(True, f"{NUM_MISSIONS} pending submissions for team {team_id}")
+
+    # Every reviewer tries to approve every submission at the same time
+    print_section(f"Benchmark: {NUM_REVIEWERS} parallel reviewers")
+    jobs = [(sid, token) for sid in submission_ids for token in reviewer_tokens]
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=NUM_REVIEWERS) as pool:
+        status_codes = list(pool.map(lambda job: review(*job), jobs))
+    elapsed = time.perf_counter() - started
+
+    approved = status_codes.count(200)
+    duplicates = status_codes.count(400)
+    errors = len(status_codes) - approved - duplicates
+
+    print(f"    Requests:          {len(jobs)}")
+    print(f"    Elapsed:           {elapsed:.2f}s")
+    print(f"    Throughput:        {len(jobs) / elapsed:.1f} reviews/s")
+    print(f"    Approved:          {approved}")
+    print(f"    Rejected as dupes: {duplicates}")
+    print(f"    Errors:            {errors}")
+
+    # Verify correctness
+    print_section("Verification")
+    team = requests.get(f"{BASE_URL}/teams/{team_id}", headers=auth(student_token)).json()
+    expected_points = NUM_MISSIONS * POINTS_PER_MISSION
+
+    print_result(approved == NUM_MISSIONS, f"Each submission approved exactly once ({approved}/{NUM_MISSIONS})")
+    print_result(errors == 0, f"No server errors ({errors})")
+    print_result(
+        team["total_points"] == expected_points,
+        f"Team points {team['total_points']} == {expected_points}"
+    )
+    print_result(
+        team["missions_completed"] == NUM_MISSIONS,
+        f"Missions completed {team['missions_completed']} == {NUM_MISSIONS}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -14,6 +14,7 @@ from app.core.config import settings
 from app.core.database import engine, init_db, Base
 from app.core.logging_config import setup_logging, get_logger
 from app.core.exceptions import register_exception_handlers
+from app.services.scheduler import scheduler
 
 # Setup logging first
 setup_logging()
@@ -22,12 +23,21 @@ logger = get_logger(__name__)
 # Import all models to register them with SQLAlchemy
 from app.models import (
     User, School, Team, TeamMember, Category, Mission, MissionSubmission,
-    Badge, UserBadge, Resource, ForumPost, Comment, Notification, LeaderboardSnapshot
+    Badge, UserBadge, Resource, ForumPost, Comment, Notification, NotificationArchive,
+    LeaderboardSnapshot, PointsLedgerEntry, PointsCheckpoint,
+    Season, SeasonStanding, ReferenceDataVersion, TeamRecommendation
 )
 
 # Import API routers
 from app.api import auth, teams, missions, leaderboard, resources, forum, stats, badges, notifications, admin
 
+# Import background jobs
+from app.services.notification_service import prune_notifications_job
+from app.services.points_service import checkpoint_points_job
+from app.services.mission_service import reconcile_mission_counters_job
+from app.services.recommendation_service import compute_recommendations_job
+from app.services.counter_buffer import flush_counters_job
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -50,10 +60,46 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"⚠️  Database initialization warning: {e}")
     
+    # Start periodic maintenance jobs
+    if settings.ENABLE_BACKGROUND_JOBS:
+        scheduler.register(
+            "prune_notifications",
+            settings.NOTIFICATION_PRUNE_INTERVAL_SECONDS,
+            prune_notifications_job
+        )
+        scheduler.register(
+            "checkpoint_points",
+            settings.POINTS_CHECKPOINT_INTERVAL_SECONDS,
+            checkpoint_points_job
+        )
+        scheduler.register(
+            "reconcile_mission_counters",
+            settings.MISSION_COUNTER_RECONCILE_INTERVAL_SECONDS,
+            reconcile_mission_counters_job
+        )
+        scheduler.register(
+            "compute_recommendations",
+            settings.RECOMMENDATIONS_INTERVAL_SECONDS,
+            compute_recommendations_job
+        )
+        scheduler.register(
+            "flush_counters",
+            settings.COUNTER_FLUSH_INTERVAL_SECONDS,
+            flush_counters_job
+        )
+        scheduler.start()
+    
     yield
     
     # Shutdown
     logger.info("👋 Shutting down NIRD Platform API...")
+    await scheduler.stop()
+    
+    # Write view/download counts still buffered in this process
+    try:
+        flush_counters_job()
+    except Exception as e:
+        logger.error(f"❌ Failed to flush buffered counters: {e}")
 
 
 app = FastAPI(
@@ -75,6 +121,7 @@ app.add_middleware(
     allow_credentials=settings.CORS_ALLOW_CREDENTIALS,
     allow_methods=settings.CORS_ALLOW_METHODS,
     allow_headers=settings.CORS_ALLOW_HEADERS,
+    expose_headers=["X-Next-Cursor"],
 )
 
 # Serve uploaded files
@@ -5,6 +5,7 @@ Tests statistics, badges, and notification endpoints
 
 import requests
 import subprocess
+import json
 from typing import Dict, Optional
 
 BASE_URL = "http://127.0.0.1:8000/api"
@@ -249,6 +250,42 @@ def test_mark_notification_read(notification_id: int, token: str):
         return False
 
 
+def test_notification_stream(token: str):
+    """Test GET /api/notifications/stream (SSE)"""
+    print("📡 Connecting to notification stream...")
+    
+    try:
+        response = requests.get(
+            f"{BASE_URL}/notifications/stream",
+            headers={"Authorization": f"Bearer {token}"},
+            stream=True,
+            timeout=10
+        )
+        
+        if response.status_code != 200:
+            print_result(False, f"Failed: {response.status_code}")
+            return False
+        
+        event = None
+        for line in response.iter_lines(decode_unicode=True):
+            if line.startswith("event:"):
+                event = line[6:].strip()
+            elif line.startswith("data:"):
+                data = json.loads(line[5:].strip())
+                response.close()
+                if event == "unread_count":
+                    print_result(True, f"Initial unread count received: {data['unread_count']}")
+                    return True
+                print_result(False, f"Unexpected first event: {event}")
+                return False
+        
+        print_result(False, "Stream closed without events")
+        return False
+    except Exception as e:
+        print_result(False, f"Error: {e}")
+        return False
+
+
 def main():
     """Run all analytics and gamification API tests"""
     print_section("📊 NIRD Platform Analytics & Gamification API Tests")
@@ -387,6 +424,9 @@ def main():
         print_section("Test 9: Mark Notification as Read")
         test_mark_notification_read(notifications[0]["id"], tokens["student1"])
     
+    print_section("Test 10: Notification Stream")
+    test_notification_stream(tokens["student1"])
+    
     # Summary
     print_section("✅ Test Summary")
     print("All analytics and gamification tests completed!")
@@ -401,6 +441,7 @@ def main():
     print("    ✓ GET    /api/notifications          - User notifications")
     print("    ✓ GET    /api/notifications/unread/count - Unread count")
     print("    ✓ PUT    /api/notifications/{id}/read - Mark as read")
+    print("    ✓ GET    /api/notifications/stream   - Live notification stream (SSE)")
     print("\n🎉 Phase 7: Analytics & Gamification is fully functional!")
 
 